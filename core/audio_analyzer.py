@@ -11,6 +11,8 @@ import time
 import logging
 import traceback
 import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Tuple, Dict, Optional, Union, Any, BinaryIO
 
@@ -63,6 +65,9 @@ class AudioAnalyzer:
         self.settings = settings
         self.speech_config = None
         self.initialized = False
+        # Serializes initialize(): startup runs it in the pool, and an early
+        # analysis request waits on it instead of initializing a second time
+        self._init_lock = threading.Lock()
 
         # Initialize caches with size limits
         self.sr_cache = {}  # Sample rate cache
@@ -70,6 +75,14 @@ class AudioAnalyzer:
         self.analysis_cache = {}  # Analysis results cache
         self.max_cache_size = 20  # Maximum items in each cache
 
+        # LRU cache of decoded audio, so switching visualizations on the same
+        # file skips the decode. Bounded by entry count and by total sample
+        # bytes, since whole-file decodes of long recordings are large.
+        self.audio_cache = OrderedDict()
+        self.max_audio_cache_size = 3
+        self.max_audio_cache_bytes = 256 * 1024 * 1024
+        self._audio_cache_lock = threading.Lock()  # Shared by pool workers
+
         # Default analysis parameters
         self.chunk_duration = 10.0  # Default preview duration in seconds
         self.spec_n_fft = 2048
@@ -250,6 +263,13 @@ class AudioAnalyzer:
         if self.initialized:
             return True
 
+        with self._init_lock:
+            if self.initialized:
+                return True
+            return self._initialize_locked()
+
+    def _initialize_locked(self) -> bool:
+        """Initialization body; the caller holds _init_lock"""
         try:
             self.logger.info("Initializing audio analyzer")
 
@@ -414,6 +434,55 @@ class AudioAnalyzer:
             return False
 
     def load_audio(self, audio_path: str, duration: Optional[float] = None, channel: int = 0, all_channels: bool = False) -> Tuple[Optional[np.ndarray], Optional[int], Optional[float], Optional[int]]:
+        """
+        Load audio, reusing recently decoded data while the file is unchanged.
+
+        Args:
+            audio_path: Path to the audio file
+            duration: Maximum duration to load in seconds (uses chunk_duration if None)
+            channel: Channel to load (0 for left/mono, 1 for right, etc.)
+            all_channels: If True, load all channels as multi-dimensional array
+
+        Returns:
+            Tuple of (audio_data, sample_rate, total_duration, num_channels) or (None, None, None, None) on error
+        """
+        if duration is None:
+            duration = self.chunk_duration
+
+        try:
+            stat = os.stat(audio_path)
+        except OSError:
+            stat = None  # Let the uncached path report the error
+
+        if stat is not None:
+            cache_key = (audio_path, stat.st_mtime_ns, stat.st_size,
+                         duration, channel, all_channels)
+            with self._audio_cache_lock:
+                cached = self.audio_cache.get(cache_key)
+                if cached is not None:
+                    self.audio_cache.move_to_end(cache_key)
+            if cached is not None:
+                self.logger.debug(f"Using cached audio for {audio_path}")
+                return cached
+
+        result = self._load_audio_uncached(audio_path, duration, channel, all_channels)
+
+        # Arrays over the whole budget are not cached at all
+        if (stat is not None and result[0] is not None
+                and result[0].nbytes <= self.max_audio_cache_bytes):
+            with self._audio_cache_lock:
+                self.audio_cache[cache_key] = result
+                while (len(self.audio_cache) > self.max_audio_cache_size
+                       or self._audio_cache_nbytes() > self.max_audio_cache_bytes):
+                    self.audio_cache.popitem(last=False)
+
+        return result
+
+    def _audio_cache_nbytes(self) -> int:
+        """Total size of the cached sample arrays (caller holds the lock)"""
+        return sum(entry[0].nbytes for entry in self.audio_cache.values())
+
+    def _load_audio_uncached(self, audio_path: str, duration: Optional[float] = None, channel: int = 0, all_channels: bool = False) -> Tuple[Optional[np.ndarray], Optional[int], Optional[float], Optional[int]]:
         """
         Load audio with optimized memory usage and error handling.
 
@@ -517,17 +586,20 @@ class AudioAnalyzer:
                 with sf.SoundFile(audio_path) as sf_file:
                     frames_to_read = int(
                         preview_duration * sf_file.samplerate) if preview_duration != total_duration else -1
-                    y = sf_file.read(frames_to_read)
+                    # Decode straight to float32 in libsndfile; the cffi call releases
+                    # the GIL, so concurrent pool workers decode in parallel
+                    y = sf_file.read(frames_to_read, dtype='float32')
 
                     # Handle multi-channel audio based on all_channels flag
                     if len(y.shape) > 1:
                         if not all_channels:
                             if channel < y.shape[1]:
-                                y = y[:, channel]  # Extract requested channel
+                                # Contiguous copy so NumPy/librosa use their fast C loops
+                                y = np.ascontiguousarray(y[:, channel])  # Extract requested channel
                             else:
                                 self.logger.warning(
                                     f"Channel {channel} not available, using first channel")
-                                y = y[:, 0]
+                                y = np.ascontiguousarray(y[:, 0])
                         # else: keep all channels intact
 
                     # Resample if needed
@@ -1211,14 +1283,26 @@ class AudioAnalyzer:
                 del self.duration_cache[file_path]
             if file_path in self.analysis_cache:
                 del self.analysis_cache[file_path]
+            with self._audio_cache_lock:
+                for key in [k for k in self.audio_cache if k[0] == file_path]:
+                    del self.audio_cache[key]
             self.logger.debug(f"Cleared cache for {file_path}")
         else:
             # Clear all caches
             self.sr_cache.clear()
             self.duration_cache.clear()
             self.analysis_cache.clear()
+            with self._audio_cache_lock:
+                self.audio_cache.clear()
             self.logger.info("Cleared all analysis caches")
 
+    def clear_audio_cache(self) -> None:
+        """
+        Release the decoded audio kept for reuse, leaving analysis results cached.
+        """
+        with self._audio_cache_lock:
+            self.audio_cache.clear()
+
     def get_cache_stats(self) -> Dict[str, int]:
         """
         Get statistics about current cache usage.
@@ -1226,13 +1310,45 @@ class AudioAnalyzer:
         Returns:
             Dictionary with cache statistics
         """
+        with self._audio_cache_lock:
+            audio_cache_bytes = self._audio_cache_nbytes()
         return {
             'sample_rate_cache': len(self.sr_cache),
             'duration_cache': len(self.duration_cache),
             'analysis_cache': len(self.analysis_cache),
+            'audio_cache': len(self.audio_cache),
+            'audio_cache_bytes': audio_cache_bytes,
             'max_cache_size': self.max_cache_size
         }
 
+    def compute_waveform_minmax(self, y: np.ndarray, width: int) -> Optional[np.ndarray]:
+        """
+        Reduce audio to per-column (min, max) pairs for direct waveform drawing.
+
+        Args:
+            y: Audio data
+            width: Number of columns (target pixel width)
+
+        Returns:
+            Array of shape (columns, 2) holding min and max per column, or None on error
+        """
+        try:
+            y = np.asarray(y, dtype=np.float32)
+            if y.size == 0 or width <= 0:
+                return None
+
+            # Never produce more columns than samples
+            width = min(width, y.size)
+            samples_per_column = y.size // width
+            frames = y[:width * samples_per_column].reshape(width, samples_per_column)
+
+            return np.column_stack((frames.min(axis=1), frames.max(axis=1)))
+
+        except Exception as e:
+            self.logger.error(f"Error computing waveform envelope: {e}")
+            self.logger.error(traceback.format_exc())
+            return None
+
     def generate_waveform(self, y: np.ndarray, sr: int) -> Optional[io.BytesIO]:
         """
         Generate optimized waveform visualization.
@@ -4,7 +4,7 @@ Audio Tooltip Application
 Main application entry point that integrates all components.
 """
 
-from utils.logging_utils import setup_logging, get_module_logger
+from utils.logging_utils import setup_logging, get_module_logger, shutdown_logging
 from utils.file_utils import (
     is_audio_file, load_recent_files, save_recent_files,
     add_recent_file, AUDIO_EXTENSIONS, validate_audio_file_path
@@ -18,9 +18,13 @@ import os
 import sys
 import time
 import threading
+import queue
 import gc
+import logging
 import traceback
 import argparse
+import hashlib
+from collections import OrderedDict
 
 # Close PyInstaller native splash screen as early as possible
 try:
@@ -35,16 +39,15 @@ except Exception:
     # Keyboard module unavailable — disable hotkey features gracefully
     keyboard = None
     KEYBOARD_AVAILABLE = False
-import subprocess
 
 # Import PyQt components
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QCursor, QPainter
-from PyQt5.QtCore import (Qt, QSettings, QTimer, QThread, pyqtSignal,
-                          QT_VERSION_STR, pyqtSlot)
+from PyQt5.QtGui import QIcon, QPixmap, QImageReader, QDesktopServices, QFont, QColor, QCursor, QPainter, QPen
+from PyQt5.QtCore import (Qt, QSettings, QTimer, QThread, QThreadPool, QRunnable, QBuffer,
+                          QObject, pyqtSignal, QT_VERSION_STR, pyqtSlot, QLineF, QSize, QUrl)
 from PyQt5.QtWidgets import (QApplication, QWidget, QSystemTrayIcon, QMenu, QAction,
                              QMessageBox, QFileDialog, QDialog, QVBoxLayout, QLabel, QPushButton, QSplashScreen, QProgressBar)
 import signal
-from functools import partial
+from functools import partial, lru_cache
 
 signal.signal(signal.SIGINT, signal.SIG_DFL)  # Allows CTRL+C to terminate
 
@@ -53,20 +56,112 @@ signal.signal(signal.SIGINT, signal.SIG_DFL)  # Allows CTRL+C to terminate
 try:
     import win32api
     import win32gui
-    from win32com.client import Dispatch
-    import pythoncom
+    # pythoncom and win32com.client are imported on the detection thread,
+    # the first time detection runs
     WINDOWS_API_AVAILABLE = True
 except ImportError:
     WINDOWS_API_AVAILABLE = False
 
+# Delay before showing the progress dialog; operations finishing sooner never show it
+PROGRESS_DIALOG_DELAY_MS = 150
+
+# Column count of the min/max envelope used to draw the Waveform visualization
+WAVEFORM_RENDER_WIDTH = 1000
+WAVEFORM_RENDER_HEIGHT = 250
+
+# Seconds the z-ordered window list stays valid between detection triggers
+EXPLORER_CACHE_TTL = 0.2
+
+# Number of decoded and scaled visualization pixmaps kept for reuse
+PIXMAP_CACHE_SIZE = 8
+
+# Top-level window classes of File Explorer windows
+EXPLORER_WINDOW_CLASSES = ("CabinetWClass", "ExploreWClass")
+
+# Longer clipboard text (Windows' extended-length path limit) cannot be a file path
+MAX_CLIPBOARD_PATH_LENGTH = 32767
+
+# COM errors of a Shell window proxy whose window or tab has closed
+# (RPC_E_DISCONNECTED, RPC_S_SERVER_UNAVAILABLE, RPC_E_SERVER_DIED_DNE)
+COM_DISCONNECTED_HRESULTS = (-2147417848, -2147023174, -2147418094)
+
+# Hotkey repeats (e.g. a held Alt+A) within this window are ignored
+HOTKEY_DEBOUNCE_SECONDS = 0.4
+
+# Quiet period before a channel switch or visualization request is acted on,
+# so rapid changes only run the analyzer for the final selection
+REQUEST_DEBOUNCE_MS = 150
+
+# Delay after the last completed analysis, visualization or transcription
+# before temp files and garbage are cleaned up; an idle app never wakes for it
+CLEANUP_DELAY_MS = 60000
+
+# Interval between middle mouse button polls when the mouse hook is unavailable
+MOUSE_POLL_INTERVAL = 0.05
+
+# Version line drawn on the splash screen (patched by scripts/build_version.py)
+SPLASH_VERSION_TEXT = "v3.0.5 - Audio Analysis Tool"
+
+# Keep the splash up at least this long so it doesn't merely flicker
+SPLASH_MIN_VISIBLE_MS = 100
+
+# Bundled resource paths, resolved once at import time. Release builds compile
+# resources.qrc into resources_rc.py so the icon is served from memory.
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+try:
+    import resources_rc  # noqa: F401 - registers the ":/" resources
+    _ICON_PATH = ":/icons/app_icon.png"
+    _ICON_EXISTS = True
+    _SPLASH_RESOURCE = ":/splash/splash.png"  # Pre-rendered by scripts/render_splash.py
+except ImportError:
+    _ICON_PATH = os.path.join(_APP_DIR, "resources", "icons", "app_icon.png")
+    _ICON_EXISTS = os.path.isfile(_ICON_PATH)
+    _SPLASH_RESOURCE = None
+
+# File dialog filters, built once from the supported extensions
+_AUDIO_PATTERNS = " ".join('*' + ext for ext in sorted(AUDIO_EXTENSIONS))
+_AUDIO_FILE_FILTERS = f"Audio Files ({_AUDIO_PATTERNS})"
+_OPEN_DIALOG_FILTERS = ";;".join(
+    # Common formats first, then all audio, then anything
+    [f"{ext[1:].upper()} Files (*{ext})"
+     for ext in ('.mp3', '.wav', '.flac', '.m4a', '.ogg') if ext in AUDIO_EXTENSIONS]
+    + [f"All Audio Files ({_AUDIO_PATTERNS})", "All Files (*.*)"])
+
+
+def file_dialog_options(settings=None):
+    """QFileDialog options honoring the "native_file_dialog" preference.
+
+    Qt's own dialog is the default: the native one can block the UI thread
+    for seconds on shell-extension thumbnails and network shares.
+    """
+    options = (QFileDialog.DontUseCustomDirectoryIcons
+               | QFileDialog.DontResolveSymlinks | QFileDialog.ReadOnly)
+    if settings is None or settings.value("native_file_dialog", "false") != "true":
+        options |= QFileDialog.DontUseNativeDialog
+    return options
+
+
+def _unpack_result(result, channel=0):
+    """Normalize an analysis result to the current 7-tuple format.
+
+    Format: (file_path, metadata, viz_buffer, transcription, num_channels, channel, time_delay).
+    Older 6-tuples lack time_delay, and 5-tuples also lack the channel.
+    """
+    if len(result) >= 7:
+        return tuple(result[:7])
+    if len(result) == 6:
+        return (*result, None)
+    return (*result, channel, None)
+
 
 class DropTargetWindow(QWidget):
     """Window that accepts audio file drops for analysis"""
 
     file_dropped = pyqtSignal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
         super().__init__(parent)
+        self.settings = settings
         self.setWindowTitle("Audio Tooltip - Drop Files Here")
         self.setAcceptDrops(True)
         self.setMinimumSize(300, 200)
@@ -103,48 +198,83 @@ class DropTargetWindow(QWidget):
         layout.addWidget(instructions, 0)
         layout.addWidget(browse_button, 0)
 
+    @staticmethod
+    def _first_audio_file(mime_data, check_exists=True):
+        """Return the first local audio file among dropped URLs, or None.
+
+        The extension is checked first, so only audio candidates are stat'ed;
+        pass check_exists=False to skip the stat entirely.
+        """
+        if not mime_data.hasUrls():
+            return None
+        # Generator stops converting URLs as soon as a match is found
+        paths = (url.toLocalFile() for url in mime_data.urls())
+        return next(
+            (path for path in paths
+             if is_audio_file(path) and (not check_exists or os.path.exists(path))),
+            None)
+
     def dragEnterEvent(self, event):
         """Handle drag enter event"""
-        if event.mimeData().hasUrls():
-            # Check if any URL is a file with audio extension
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if is_audio_file(file_path) and os.path.exists(file_path):
-                    event.acceptProposedAction()
-                    return
+        # Extension check only: a stat here could block on network paths,
+        # and existence is verified on drop
+        if self._first_audio_file(event.mimeData(), check_exists=False):
+            event.acceptProposedAction()
 
     def dropEvent(self, event):
         """Handle drop event"""
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if is_audio_file(file_path) and os.path.exists(file_path):
-                self.file_dropped.emit(file_path)
-                # Process only the first valid audio file
-                break
+        # Process only the first valid audio file
+        file_path = self._first_audio_file(event.mimeData())
+        if file_path:
+            self.file_dropped.emit(file_path)
 
         event.acceptProposedAction()
 
     def browse_files(self):
         """Open file dialog to browse for audio files"""
-        file_filters = f"Audio Files ({' '.join(['*' + ext for ext in AUDIO_EXTENSIONS])})"
-
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Audio File",
             "",
-            file_filters
+            _AUDIO_FILE_FILTERS,
+            options=file_dialog_options(self.settings)
         )
 
         if file_path:
             self.file_dropped.emit(file_path)
 
 
-class TranscriptionWorker(QThread):
-    """Worker thread for speech transcription"""
+class WorkerSignals(QObject):
+    """Signals emitted by pool workers (QRunnable is not a QObject)"""
 
-    finished = pyqtSignal(str)
+    finished = pyqtSignal(object)
+    progress = pyqtSignal(str)
     error = pyqtSignal(str)
-    file_saved = pyqtSignal(str)  # New signal for file path
+    invalid_file = pyqtSignal(str)
+    file_saved = pyqtSignal(str)
+
+
+class PoolWorker(QRunnable):
+    """Base class for workers executed on the shared QThreadPool"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = WorkerSignals()
+        # Expose the signals on the worker itself, like a QThread worker
+        self.finished = self.signals.finished
+        self.progress = self.signals.progress
+        self.error = self.signals.error
+        self.invalid_file = self.signals.invalid_file
+        self.file_saved = self.signals.file_saved
+        self._cancelled = False
+
+    def cancel(self):
+        """Signal the worker to stop at the next checkpoint."""
+        self._cancelled = True
+
+
+class TranscriptionWorker(PoolWorker):
+    """Worker for speech transcription"""
 
     def __init__(self, analyzer, file_path, channel, language=None, transcription_channel=-1):
         super().__init__()
@@ -180,16 +310,15 @@ class TranscriptionWorker(QThread):
                 output_file = os.path.join(
                     output_dir, f"{base_name}_{channel_info}_{lang_code}_{timestamp}_transcript.txt")
 
-                # Save transcription to file
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(transcription)
+                # Save transcription to file: encode once and write in a single call,
+                # keeping the platform line endings text mode would have produced
+                encoded = transcription.replace('\n', os.linesep).encode('utf-8')
+                with open(output_file, 'wb') as f:
+                    f.write(encoded)
 
                 self.logger.info(f"Transcription saved to: {output_file}")
 
-                # Open the file in the default text editor
-                self.open_text_file(output_file)
-
-                # Emit signals
+                # Emit signals; the app opens the saved file from the UI thread
                 self.finished.emit(transcription)
                 self.file_saved.emit(output_file)
             else:
@@ -200,27 +329,9 @@ class TranscriptionWorker(QThread):
             self.logger.error(traceback.format_exc())
             self.error.emit(f"Error: {str(e)}")
 
-    def open_text_file(self, file_path):
-        """Open text file in default editor"""
-        try:
-            if os.name == 'nt':  # Windows
-                os.startfile(file_path)
-            elif os.name == 'posix':  # macOS, Linux
-                if os.uname().sysname == 'Darwin':  # macOS
-                    subprocess.Popen(['open', file_path])
-                else:  # Linux
-                    subprocess.Popen(['xdg-open', file_path])
-
-            self.logger.info(f"Opened transcription file: {file_path}")
-        except Exception as e:
-            self.logger.error(f"Failed to open transcription file: {e}")
-
 
-class VisualizationWorker(QThread):
-    """Worker thread for generating visualizations"""
-
-    finished = pyqtSignal(object)
-    error = pyqtSignal(str)
+class VisualizationWorker(PoolWorker):
+    """Worker for generating visualizations"""
 
     def __init__(self, analyzer, file_path, viz_type, channel, duration):
         super().__init__()
@@ -230,12 +341,26 @@ class VisualizationWorker(QThread):
         self.channel = channel
         self.duration = duration
         self.logger = get_module_logger("VisualizationWorker")
+        self.done = False  # Set once run() has returned
+
+    def is_pending(self):
+        """True if this worker may still deliver a visualization"""
+        return not self.done and not self._cancelled
 
     def run(self):
         """Generate the visualization"""
+        try:
+            self._generate()
+        finally:
+            self.done = True
+
+    def _generate(self):
         self.logger.info(
             f"Generating {self.viz_type} for {self.file_path}, channel {self.channel}")
 
+        if self._cancelled:
+            return
+
         try:
 
             # For Double Waveform, we need a special handling since it requires both channels
@@ -256,10 +381,16 @@ class VisualizationWorker(QThread):
                 self.error.emit(f"Failed to load audio for {self.viz_type}")
                 return
 
+            # A newer request superseded this one while the audio was loading
+            if self._cancelled:
+                return
+
             # Generate visualization based on type
             viz_buffer = None
             if self.viz_type == "Waveform":
-                viz_buffer = self.analyzer.generate_waveform(y, sr)
+                # Waveform is drawn directly with QPainter, skipping the PNG round-trip
+                viz_buffer = self.analyzer.compute_waveform_minmax(
+                    y, WAVEFORM_RENDER_WIDTH)
             elif self.viz_type == "Spectrogram":
                 viz_buffer = self.analyzer.generate_spectrogram(
                     y, sr, high_quality=True)
@@ -268,7 +399,10 @@ class VisualizationWorker(QThread):
             elif self.viz_type == "Chromagram":
                 viz_buffer = self.analyzer.generate_chromagram(y, sr)
 
-            if viz_buffer:
+            if self._cancelled:
+                return
+
+            if viz_buffer is not None:
                 self.finished.emit((viz_buffer, self.viz_type))
             else:
                 self.error.emit(f"Failed to generate {self.viz_type}")
@@ -279,12 +413,8 @@ class VisualizationWorker(QThread):
             self.error.emit(f"Error: {str(e)}")
 
 
-class AudioTooltipWorker(QThread):
-    """Worker thread for audio file processing"""
-
-    finished = pyqtSignal(object)
-    progress = pyqtSignal(str)
-    error = pyqtSignal(str)
+class AudioTooltipWorker(PoolWorker):
+    """Worker for audio file processing"""
 
     def __init__(self, analyzer, file_path, channel=0, force_refresh=False):
         super().__init__()
@@ -293,14 +423,22 @@ class AudioTooltipWorker(QThread):
         self.channel = channel
         self.force_refresh = force_refresh
         self.logger = get_module_logger("AudioTooltipWorker")
-        self._cancelled = False
+        self.done = False  # Set once run() has returned
+        self.file_key = None  # (abspath, mtime_ns, size) of the analyzed file
 
-    def cancel(self):
-        """Signal the worker to stop at the next checkpoint."""
-        self._cancelled = True
+    def is_pending_for(self, file_path, channel):
+        """True if this worker is still going to deliver a result for file_path/channel"""
+        return (not self.done and not self._cancelled and self.channel == channel
+                and os.path.abspath(self.file_path) == os.path.abspath(file_path))
 
     def run(self):
         """Process audio file"""
+        try:
+            self._analyze()
+        finally:
+            self.done = True
+
+    def _analyze(self):
         self.logger.info(
             f"Starting worker for {self.file_path}, channel {self.channel}, force_refresh: {self.force_refresh}")
 
@@ -308,6 +446,23 @@ class AudioTooltipWorker(QThread):
             return
 
         try:
+            # Validate here rather than on the UI thread, since it opens the file
+            is_valid, error_message = validate_audio_file_path(
+                self.file_path, self.logger)
+            if not is_valid:
+                self.invalid_file.emit(error_message)
+                return
+
+            # Identify this version of the file, stat'ed here off the UI thread
+            try:
+                stat = os.stat(self.file_path)
+                self.file_key = (os.path.abspath(self.file_path), stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+
+            if self._cancelled:
+                return
+
             # Ensure analyzer is initialized
             if not self.analyzer.initialized:
                 self.progress.emit("Initializing analyzer...")
@@ -341,6 +496,59 @@ class AudioTooltipWorker(QThread):
             self.error.emit(f"Error: {str(e)}")
 
 
+class ImageDecodeWorker(PoolWorker):
+    """Worker for decoding and scaling visualization images"""
+
+    def __init__(self, data, width, height):
+        super().__init__()
+        self.data = data
+        self.width = width
+        self.height = height
+
+    def run(self):
+        """Decode PNG bytes into a QImage scaled to fit width x height"""
+        # QImage (unlike QPixmap) may be used outside the GUI thread
+        buffer = QBuffer()
+        buffer.setData(self.data)
+        reader = QImageReader(buffer)
+
+        # Decode straight to the display size; the header gives the source size
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(
+                self.width, self.height, Qt.KeepAspectRatio))
+
+        image = reader.read()
+        if image.isNull():
+            self.error.emit("Failed to decode visualization image")
+            return
+        self.finished.emit(image)
+
+
+class PathExistsWorker(PoolWorker):
+    """Worker for checking file existence (a stat can block on network paths)"""
+
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+
+    def run(self):
+        """Emit the list of paths that no longer exist"""
+        self.finished.emit([path for path in self.paths if not os.path.exists(path)])
+
+
+class AnalyzerInitWorker(PoolWorker):
+    """Worker for the analyzer's non-GUI startup work (settings, speech services)"""
+
+    def __init__(self, analyzer):
+        super().__init__()
+        self.analyzer = analyzer
+
+    def run(self):
+        """Initialize the analyzer off the GUI thread"""
+        self.finished.emit(self.analyzer.initialize())
+
+
 class AudioTooltipApp(QWidget):
     """Enhanced main application with improved architecture and error handling"""
 
@@ -349,7 +557,9 @@ class AudioTooltipApp(QWidget):
     showProgressSignal = pyqtSignal(str)
     hideProgressSignal = pyqtSignal()
     file_detected_signal = pyqtSignal(str)
+    no_file_detected_signal = pyqtSignal()
     show_drop_window_signal = pyqtSignal()
+    initialized = pyqtSignal()
 
     def __init__(self, startup_mode=False):
         super().__init__()
@@ -375,7 +585,6 @@ class AudioTooltipApp(QWidget):
         self.audio_playback = AudioPlayback()
 
         # Connect components
-        self.audio_analyzer.initialize()
         self.tooltip.audio_player = self.audio_playback
         self.tooltip.on_settings_requested = self.show_settings
         self.tooltip.on_channel_changed = self.on_channel_changed
@@ -385,25 +594,97 @@ class AudioTooltipApp(QWidget):
 
         # Initialize recent files
         self.recent_files = load_recent_files(self.settings)
+        self._recent_menu_generation = 0  # Discards stale existence checks
+        # Open-dialog start folder; load_recent_files already checked existence
+        self._cached_start_dir = os.path.dirname(self.recent_files[0]) if self.recent_files else ""
+
+        # App-owned pool for analysis, visualization and transcription workers,
+        # leaving headroom for the UI and input tracking threads; recent-file
+        # existence checks, which may block on network paths, use the global pool
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 3))
+        self.current_worker = None  # Latest analysis worker, cancelable from the progress dialog
+        self.current_viz_worker = None  # Latest visualization worker, canceled when superseded
+
+        # LRU cache of decoded, scaled visualization pixmaps keyed by (digest, width, height)
+        self._scaled_pixmap_cache = OrderedDict()
+        self._viz_request_id = 0
+
+        # LRU cache of shown visualizations keyed by ((path, mtime, size), channel, type, duration),
+        # so re-selecting a visualization skips the worker pipeline entirely
+        self._viz_pixmap_cache = OrderedDict()
+        self._current_file_key = None  # (abspath, mtime_ns, size) of the shown file
+
+        # Cached primary screen geometry, dropped whenever a monitor, the
+        # primary screen or a screen's work area (e.g. taskbar) changes
+        self._screen_rect = None
+        app = QApplication.instance()
+        for screen in app.screens():
+            screen.availableGeometryChanged.connect(self._invalidate_screen_cache)
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._invalidate_screen_cache)
+        app.primaryScreenChanged.connect(self._invalidate_screen_cache)
+
+        # Debounce the progress dialog so fast operations don't flash it
+        self.progress_dialog = None
+        self._pending_progress_message = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._show_pending_progress)
+
+        # Coalesce rapid channel switches and visualization requests
+        self._pending_channel = None
+        self._channel_debounce_timer = QTimer(self)
+        self._channel_debounce_timer.setSingleShot(True)
+        self._channel_debounce_timer.setInterval(REQUEST_DEBOUNCE_MS)
+        self._channel_debounce_timer.timeout.connect(self._run_pending_channel_change)
+        self._pending_visualization = None
+        self._viz_debounce_timer = QTimer(self)
+        self._viz_debounce_timer.setSingleShot(True)
+        self._viz_debounce_timer.setInterval(REQUEST_DEBOUNCE_MS)
+        self._viz_debounce_timer.timeout.connect(self._run_pending_visualization)
 
         # Connect signals
         self.showTooltipSignal.connect(self.show_tooltip_slot)
-        self.showProgressSignal.connect(self.show_progress_dialog)
+        self.showProgressSignal.connect(self.schedule_progress_dialog)
         self.hideProgressSignal.connect(self.hide_progress_dialog)
-        self.file_detected_signal.connect(self.analyze_file)
+        # Emitted from the detection thread; queued so COM probing never
+        # waits on the UI and the UI never waits on COM
+        self.file_detected_signal.connect(self.analyze_file, Qt.QueuedConnection)
+        self.no_file_detected_signal.connect(self._on_no_explorer_file, Qt.QueuedConnection)
         self.show_drop_window_signal.connect(self.show_drop_window_slot)
 
         # Initialize detection state before setup_hotkeys so on_hotkey()
         # never races against an uninitialized lock or flag.
         self.detection_active = False
         self._detection_lock = threading.Lock()
+        self._explorer_cache = None  # (timestamp, foreground HWND, z-ordered HWNDs)
+        # Shell.Application, its live ShellWindows collection and the window
+        # proxies grouped by HWND, only touched by the detection thread
+        self._shell_app = None
+        self._shell_windows = None
+        self._shell_windows_cache = {}
+        self._shell_cache_key = None  # (Explorer HWNDs, Shell window count) of the cache
+        self._last_hotkey_ts = 0.0
+
+        # Clear stale hotkeys first: setup_tray registers Alt+D
+        self.setup_hotkeys()
 
         # Setup system tray
         self.setup_tray()
-        self.setup_hotkeys()
 
         # Start tracking thread if available
+        self.drop_window = None
+        self.tracking_thread = None
         self.running = True
+        self._shutdown_event = threading.Event()
+        self._middle_click_listener = None  # Mouse hook listener run by the tracking thread
+
+        # Detection requests from hotkey, mouse and tray run on one long-lived thread
+        self._detection_queue = queue.Queue()
+        self.detection_thread = threading.Thread(target=self._detection_loop)
+        self.detection_thread.daemon = True
+        self.detection_thread.start()
         if WINDOWS_API_AVAILABLE or KEYBOARD_AVAILABLE:
             self.tracking_thread = threading.Thread(target=self.track_input)
             self.tracking_thread.daemon = True
@@ -412,22 +693,29 @@ class AudioTooltipApp(QWidget):
             self.module_logger.warning(
                 "Input tracking unavailable - missing dependencies")
 
+        # Heavy analyzer setup runs in the pool while the splash stays responsive
+        init_worker = AnalyzerInitWorker(self.audio_analyzer)
+        init_worker.finished.connect(self.initialized)
+        self.thread_pool.start(init_worker)
+
         # Periodic cleanup timer
         self.cleanup_timer = QTimer(self)
-        self.cleanup_timer.timeout.connect(self.perform_cleanup)
-        self.cleanup_timer.start(60000)  # Run every minute
+        self.cleanup_timer.setSingleShot(True)
+        self.cleanup_timer.setInterval(CLEANUP_DELAY_MS)
+        self.cleanup_timer.timeout.connect(self._cleanup_when_idle)
 
         self.module_logger.info("Application initialized")
 
-    def _emit_hide_progress(self, _result=None):
-        """Relay slot: discards worker result and emits hideProgressSignal."""
-        self.hideProgressSignal.emit()
-
     def refresh_analysis(self, file_path, channel):
         """Force a refresh of the audio analysis"""
         self.module_logger.info(
             f"Forcing refresh of {file_path}, channel {channel}")
 
+        # Drop cached visualizations of this file so they are regenerated
+        abs_path = os.path.abspath(file_path)
+        for key in [k for k in self._viz_pixmap_cache if k[0][0] == abs_path]:
+            del self._viz_pixmap_cache[key]
+
         # Call analyze_file with force_refresh=True
         self.analyze_file(file_path, channel, force_refresh=True)
 
@@ -440,9 +728,9 @@ class AudioTooltipApp(QWidget):
         """Show the drop target window (runs in main thread)"""
         self.module_logger.info("Showing drop window in main thread")
         try:
-            if not hasattr(self, 'drop_window') or self.drop_window is None:
+            if self.drop_window is None:
                 self.module_logger.info("Creating new drop window")
-                self.drop_window = DropTargetWindow()
+                self.drop_window = DropTargetWindow(settings=self.settings)
                 self.drop_window.file_dropped.connect(self.analyze_file)
 
             self.module_logger.info("Showing drop window")
@@ -466,11 +754,9 @@ class AudioTooltipApp(QWidget):
         """Setup global hotkeys for the application"""
         try:
             if KEYBOARD_AVAILABLE:
-                # Remove all previous hotkeys to avoid duplicates
+                # Remove all previous hotkeys to avoid duplicates, in one call
                 try:
-                    keyboard.remove_hotkey('alt+a')
-                    keyboard.remove_hotkey('alt+q')
-                    keyboard.remove_hotkey('ctrl+alt+a')
+                    keyboard.unhook_all_hotkeys()
                 except Exception:
                     pass
             else:
@@ -493,6 +779,8 @@ class AudioTooltipApp(QWidget):
         # Input detection settings
         if not self.settings.contains("auto_close"):
             self.settings.setValue("auto_close", "true")
+        if not self.settings.contains("native_file_dialog"):
+            self.settings.setValue("native_file_dialog", "false")
 
         # Analysis settings
         if not self.settings.contains("preview_duration"):
@@ -514,15 +802,20 @@ class AudioTooltipApp(QWidget):
             if not self.settings.contains(key):
                 self.settings.setValue(key, "true")
 
-        # Set startup by default on first run only
+        # Set startup by default on first run only; the registry write is
+        # deferred to the event loop so it stays off the constructor path
         if not self.settings.contains("start_with_windows"):
-            try:
-                from utils.startup_utils import StartupManager
-                startup_mgr = StartupManager()
-                startup_mgr.enable_startup()
-                self.settings.setValue("start_with_windows", True)
-            except Exception as e:
-                self.module_logger.warning(f"Could not set startup: {e}")
+            QTimer.singleShot(0, self._enable_startup_on_first_run)
+
+    def _enable_startup_on_first_run(self):
+        """Register the app in the Windows Run key (first run only)"""
+        try:
+            from utils.startup_utils import StartupManager
+            startup_mgr = StartupManager()
+            startup_mgr.enable_startup()
+            self.settings.setValue("start_with_windows", True)
+        except Exception as e:
+            self.module_logger.warning(f"Could not set startup: {e}")
 
     def _setting_bool(self, key: str, default: bool = False) -> bool:
         """Read a boolean setting stored as 'true'/'false' string."""
@@ -540,10 +833,8 @@ class AudioTooltipApp(QWidget):
         self.tray_icon = QSystemTrayIcon(self)
 
         # Load icon or create placeholder
-        icon_path = os.path.join(os.path.dirname(
-            os.path.abspath(__file__)), "resources/icons/app_icon.png")
-        if os.path.exists(icon_path):
-            self.tray_icon.setIcon(QIcon(icon_path))
+        if _ICON_EXISTS:
+            self.tray_icon.setIcon(QIcon(_ICON_PATH))
         else:
             # Create placeholder icon
             icon_pixmap = QPixmap(32, 32)
@@ -656,18 +947,34 @@ class AudioTooltipApp(QWidget):
     def update_recent_menu(self):
         """Update the recent files menu"""
         self.recent_menu.clear()
+        self._recent_menu_generation += 1
 
+        # Add every entry right away; existence is checked in the pool
+        actions = {}
         for file_path in self.recent_files:
-            if os.path.exists(file_path):
-                action = QAction(os.path.basename(file_path), self)
-                action.setData(file_path)
-                action.triggered.connect(self.open_recent_file)
-                self.recent_menu.addAction(action)
+            action = QAction(os.path.basename(file_path), self)
+            action.setData(file_path)
+            action.triggered.connect(self.open_recent_file)
+            self.recent_menu.addAction(action)
+            actions[file_path] = action
 
         if not self.recent_files:
             empty_action = QAction("No recent files", self)
             empty_action.setEnabled(False)
             self.recent_menu.addAction(empty_action)
+            return
+
+        worker = PathExistsWorker(list(actions))
+        worker.finished.connect(partial(
+            self._disable_missing_recent_files, self._recent_menu_generation, actions))
+        QThreadPool.globalInstance().start(worker)
+
+    def _disable_missing_recent_files(self, generation, actions, missing):
+        """Gray out recent entries whose files are gone, unless the menu was rebuilt"""
+        if generation != self._recent_menu_generation:
+            return
+        for file_path in missing:
+            actions[file_path].setEnabled(False)
 
     def tray_icon_clicked(self, reason):
         """Handle tray icon activation"""
@@ -712,30 +1019,9 @@ class AudioTooltipApp(QWidget):
         """Open file dialog to select audio file"""
         self.module_logger.info("Opening file selection dialog")
 
-        # Create a list of file filters
-        filter_list = []
-
-        # Add specific formats first
-        common_formats = ['.mp3', '.wav', '.flac', '.m4a', '.ogg']
-        for ext in common_formats:
-            if ext in AUDIO_EXTENSIONS:
-                filter_name = ext[1:].upper()  # Remove dot and capitalize
-                filter_list.append(f"{filter_name} Files (*{ext})")
-
-        # Add comprehensive filter
-        all_exts = " ".join(['*' + ext for ext in AUDIO_EXTENSIONS])
-        filter_list.append(f"All Audio Files ({all_exts})")
-
-        # Add All Files filter
-        filter_list.append("All Files (*.*)")
-
-        # Join all filters
-        file_filters = ";;".join(filter_list)
-
-        # Determine starting directory
-        start_dir = ""
-        if self.recent_files and os.path.exists(os.path.dirname(self.recent_files[0])):
-            start_dir = os.path.dirname(self.recent_files[0])
+        # Start in the folder of the last analyzed file; no stat here, since it
+        # could hang on a disconnected share (the dialog falls back if it is gone)
+        start_dir = self._cached_start_dir
 
         # Open dialog
         try:
@@ -743,7 +1029,8 @@ class AudioTooltipApp(QWidget):
                 None,  # Use None instead of self to ensure dialog is properly modal
                 "Select Audio File",
                 start_dir,
-                file_filters
+                _OPEN_DIALOG_FILTERS,
+                options=file_dialog_options(self.settings)
             )
 
             if file_path:
@@ -805,45 +1092,80 @@ class AudioTooltipApp(QWidget):
         """Clean up and close the application"""
         self.module_logger.info("Closing application")
         self.running = False
+        self._shutdown_event.set()
+        self._detection_queue.put(None)
+        listener = self._middle_click_listener
+        if listener is not None:
+            listener.stop()
 
         # Wait for tracking thread to exit
-        if hasattr(self, 'tracking_thread') and self.tracking_thread.is_alive():
+        if self.tracking_thread is not None and self.tracking_thread.is_alive():
             self.tracking_thread.join(timeout=1.0)
 
-        # Hide tooltip and cleanup resources
+        # Hide tooltip
         self.tooltip.hide()
-        if hasattr(self.tooltip, 'audio_player'):
-            self.tooltip.audio_player.cleanup()
 
-        # Final cleanup
-        self.perform_cleanup()
+        # Drop queued workers that have not started yet
+        self.thread_pool.clear()
+        QThreadPool.globalInstance().clear()
+
+        # Remove playback temp files (the tooltip's audio player is
+        # self.audio_playback); no garbage collection, the process is exiting
+        self.audio_playback.cleanup()
 
         # Quit application
         QApplication.quit()
 
+    def schedule_cleanup(self):
+        """Run perform_cleanup once activity has settled (restarts the delay)"""
+        self.cleanup_timer.start()
+
+    def _cleanup_when_idle(self):
+        """Cleanup timer slot: collect garbage only while the app is in the
+        background, so the collection pause never lands on an active UI"""
+        if QApplication.applicationState() == Qt.ApplicationActive:
+            self.schedule_cleanup()
+            return
+        self.perform_cleanup()
+
     def perform_cleanup(self):
-        """Periodic cleanup to prevent memory leaks"""
+        """Cleanup after activity to prevent memory leaks"""
         self.module_logger.debug("Performing periodic cleanup")
 
         # Clean up audio playback temp files
-        if hasattr(self, 'audio_playback'):
-            self.audio_playback.cleanup()
+        self.audio_playback.cleanup()
+
+        # Release decoded audio; it only speeds up requests made in quick succession
+        self.audio_analyzer.clear_audio_cache()
 
         # Force garbage collection
         collected = gc.collect()
         self.module_logger.debug(
             f"Garbage collection: {collected} objects collected")
 
+    def schedule_progress_dialog(self, message):
+        """Show progress dialog after a short delay, or update it if already visible"""
+        if self.progress_dialog is not None:
+            self.progress_dialog.update_message(message)
+            return
+        self._pending_progress_message = message
+        self._progress_timer.start(PROGRESS_DIALOG_DELAY_MS)
+
+    def _show_pending_progress(self):
+        """Timer slot: show the progress dialog with the last scheduled message"""
+        if self._pending_progress_message is not None:
+            self.show_progress_dialog(self._pending_progress_message)
+            self._pending_progress_message = None
+
     def show_progress_dialog(self, message):
         """Show progress dialog in main thread"""
-        if not hasattr(self, 'progress_dialog') or self.progress_dialog is None:
+        if self.progress_dialog is None:
             self.progress_dialog = ProgressDialog(
                 None, "Analyzing Audio", message, cancelable=True)
             self.progress_dialog.setWindowModality(Qt.NonModal)
-            if hasattr(self, 'workers') and self.workers:
-                current_worker = self.workers[-1]
+            if self.current_worker is not None:
                 self.progress_dialog.rejected.connect(
-                    partial(self._cancel_current_worker, current_worker))
+                    partial(self._cancel_current_worker, self.current_worker))
         else:
             self.progress_dialog.update_message(message)
 
@@ -857,7 +1179,10 @@ class AudioTooltipApp(QWidget):
 
     def hide_progress_dialog(self):
         """Hide progress dialog"""
-        if hasattr(self, 'progress_dialog') and self.progress_dialog is not None:
+        # Cancel a pending show so fast operations never display the dialog
+        self._progress_timer.stop()
+        self._pending_progress_message = None
+        if self.progress_dialog is not None:
             self.progress_dialog.accept()
             self.progress_dialog = None
 
@@ -868,22 +1193,20 @@ class AudioTooltipApp(QWidget):
             f"Analyzing file: {file_path}, channel: {channel}, force_refresh: {force_refresh}")
 
         try:
-            # Validate file path
-            is_valid, error_message = validate_audio_file_path(
-                file_path, self.module_logger)
-            if not is_valid:
-                self.module_logger.error(
-                    f"Invalid audio file: {error_message}")
-                QMessageBox.warning(
-                    None,
-                    "Invalid Audio File",
-                    f"Cannot analyze this file:\n{error_message}"
-                )
+            # A repeated request joins the identical analysis already running
+            # instead of decoding the file a second time
+            if (not force_refresh and self.current_worker is not None
+                    and self.current_worker.is_pending_for(file_path, channel)):
+                self.module_logger.info(
+                    f"Analysis already running for {file_path}, channel {channel}")
                 return
 
-            # Ensure we keep track of workers
-            if not hasattr(self, "workers"):
-                self.workers = []  # Store all workers to prevent garbage collection
+            # Supersede any analysis still running (e.g. rapid channel switches)
+            if self.current_worker is not None:
+                self.current_worker.cancel()
+
+            # Repeat analyses are answered from AudioAnalyzer.analysis_cache in
+            # the worker, which stats the file there rather than on the UI thread
 
             # Create worker for async processing with force_refresh parameter
             try:
@@ -891,38 +1214,22 @@ class AudioTooltipApp(QWidget):
                     self.audio_analyzer, file_path, channel, force_refresh)
 
                 # Connect worker signals
-                try:
-                    worker.finished.connect(
-                        partial(self.handle_analysis_result, file_path=file_path, channel=channel))
-                    worker.progress.connect(self.showProgressSignal.emit)
-                    worker.error.connect(self.handle_worker_error)
-                    worker.finished.connect(
-                        partial(self._cleanup_worker_on_finish, worker))  # Clean up when done
-                except Exception as connect_e:
-                    self.module_logger.error(
-                        f"Error connecting worker signals: {connect_e}")
-                    raise
-
-                # Store worker reference
-                self.workers.append(worker)
+                worker.finished.connect(partial(self._on_analysis_finished, worker))
+                worker.progress.connect(self.showProgressSignal)
+                worker.error.connect(self.handle_worker_error)
+                worker.invalid_file.connect(self.handle_invalid_file)
+
+                # Remember the worker so the progress dialog can cancel it
+                self.current_worker = worker
 
                 # Show progress dialog
-                try:
-                    self.showProgressSignal.emit(
-                        f"Analyzing {os.path.basename(file_path)} (channel {channel+1})...")
-                except Exception as signal_e:
-                    self.module_logger.error(
-                        f"Error emitting progress signal: {signal_e}")
+                self.showProgressSignal.emit(
+                    f"Analyzing {os.path.basename(file_path)} (channel {channel+1})...")
 
                 # Start worker
-                try:
-                    worker.start()
-                    self.module_logger.info(
-                        f"Worker started successfully for {file_path}")
-                except Exception as start_e:
-                    self.module_logger.error(
-                        f"Error starting worker: {start_e}")
-                    raise
+                self.thread_pool.start(worker)
+                self.module_logger.info(
+                    f"Worker started successfully for {file_path}")
 
             except Exception as worker_e:
                 self.module_logger.error(
@@ -950,6 +1257,12 @@ class AudioTooltipApp(QWidget):
         self.module_logger.info(
             f"Using synchronous processing for {file_path}")
         try:
+            is_valid, error_message = validate_audio_file_path(
+                file_path, self.module_logger)
+            if not is_valid:
+                self.handle_invalid_file(error_message)
+                return
+
             # Process directly without worker
             result = self.audio_analyzer.process_audio_file(
                 file_path, channel, force_refresh=force_refresh)
@@ -963,50 +1276,30 @@ class AudioTooltipApp(QWidget):
             self.module_logger.error(traceback.format_exc())
             self.handle_worker_error(f"Error: {str(e)}")
 
-    def cleanup_worker(self, worker):
-        """Remove worker from list when finished"""
-        if hasattr(self, "workers") and worker in self.workers:
-            self.workers.remove(worker)
-
-    def _cleanup_worker_on_finish(self, worker, result):
-        """Slot for worker finished signal that delegates to cleanup_worker, ignoring result."""
-        self.cleanup_worker(worker)
+    def _on_analysis_finished(self, worker, result):
+        """Forward a worker's result along with the file identity it stat'ed"""
+        self.handle_analysis_result(result, worker.file_path, worker.channel, worker.file_key)
 
-    def _cleanup_list_worker(self, worker_list, worker):
-        """Remove a finished worker from its tracking list."""
-        if worker in worker_list:
-            worker_list.remove(worker)
-
-    def handle_analysis_result(self, result, file_path, channel):
+    def handle_analysis_result(self, result, file_path, channel, file_key=None):
         """Handle successful audio analysis"""
         self.module_logger.info(
             f"Analysis complete for: {file_path}, channel {channel}")
         self.hideProgressSignal.emit()
+        self.schedule_cleanup()
         self.tooltip.hide_loading()
 
         if result:
+            self._cached_start_dir = os.path.dirname(file_path)
+            # Identifies the shown file's version for the visualization cache
+            self._current_file_key = file_key
+
             # Add to recent files
             self.recent_files = add_recent_file(
                 self.settings, file_path, self.recent_files)
             self.update_recent_menu()
 
-            # Unpack the result tuple with the correct number of values
-            # Format: (file_path, metadata, viz_buffer, transcription, num_channels, channel, time_delay)
-            if len(result) >= 7:
-                file_path, metadata, viz_buffer, transcription, num_channels, channel, time_delay = result
-            else:
-                # Handle older format for backward compatibility
-                file_path, metadata, viz_buffer, transcription, num_channels = result
-                time_delay = None
-
             # Show tooltip with results
-            final_result = (file_path, metadata, viz_buffer,
-                            transcription, num_channels, channel)
-            if len(result) >= 7:
-                # Include time_delay in final result if available
-                final_result = final_result + (time_delay,)
-
-            self.showTooltipSignal.emit(final_result)
+            self.showTooltipSignal.emit(_unpack_result(result, channel))
 
             # Connect channel change handler
             self.tooltip.on_channel_changed = self.on_channel_changed
@@ -1018,11 +1311,29 @@ class AudioTooltipApp(QWidget):
         """Handle channel selection change in tooltip"""
         self.module_logger.info(f"Channel changed to {channel+1}")
         self.tooltip.show_loading()
-        if self.tooltip.current_file:
+        # Restarting the timer means only the last of several quick switches runs
+        self._pending_channel = channel
+        self._channel_debounce_timer.start()
+
+    def _run_pending_channel_change(self):
+        """Debounce timer slot: analyze the last selected channel"""
+        channel, self._pending_channel = self._pending_channel, None
+        if channel is not None and self.tooltip.current_file:
             self.analyze_file(self.tooltip.current_file, channel)
 
     def on_visualization_requested(self, viz_type, channel):
-        """Handle visualization run request"""
+        """Handle visualization run request (debounced)"""
+        self._pending_visualization = (viz_type, channel)
+        self._viz_debounce_timer.start()
+
+    def _run_pending_visualization(self):
+        """Debounce timer slot: generate the last requested visualization"""
+        request, self._pending_visualization = self._pending_visualization, None
+        if request is not None:
+            self._generate_visualization(*request)
+
+    def _generate_visualization(self, viz_type, channel):
+        """Show or generate the requested visualization"""
         self.module_logger.info(
             f"Visualization requested: {viz_type} for channel {channel+1}")
 
@@ -1034,45 +1345,131 @@ class AudioTooltipApp(QWidget):
         use_whole_signal = self._setting_bool("use_whole_signal", False)
         preview_duration = -1 if use_whole_signal else self._setting_int("preview_duration", 10)
 
+        # Show a previously generated visualization straight away, keyed by the
+        # file version stat'ed when it was analyzed (no stat on the UI thread)
+        file_key = self._current_file_key
+        viz_key = (file_key, channel, viz_type, preview_duration) if file_key else None
+        pixmap = self._viz_pixmap_cache.get(viz_key) if viz_key else None
+        if pixmap is not None:
+            self._viz_pixmap_cache.move_to_end(viz_key)
+            # Supersede a visualization still being generated; its progress
+            # dialog would otherwise stay up, as a canceled worker never reports
+            if self.current_viz_worker is not None and self.current_viz_worker.is_pending():
+                self.current_viz_worker.cancel()
+                self.hide_progress_dialog()
+            self.current_viz_worker = None
+            self._viz_request_id += 1
+            self._show_visualization(pixmap, viz_type)
+            return
+
         # Show progress dialog
         self.showProgressSignal.emit(f"Generating {viz_type}...")
 
-        # Run in a worker thread
+        # Run in the worker pool
         worker = VisualizationWorker(
             self.audio_analyzer, self.tooltip.current_file, viz_type, channel, preview_duration)
-        worker.finished.connect(self.update_visualization)
+        worker.finished.connect(partial(self.update_visualization, viz_key=viz_key))
         worker.error.connect(self.handle_worker_error)
-        worker.finished.connect(self._emit_hide_progress)
-        worker.finished.connect(lambda _, w=worker: self._cleanup_list_worker(self.viz_workers, w))
+        # Signal-to-signal connection; Qt drops the result argument
+        worker.finished.connect(self.hideProgressSignal)
 
-        # Store worker reference
-        if not hasattr(self, "viz_workers"):
-            self.viz_workers = []
-        self.viz_workers.append(worker)
+        # Only the latest visualization is shown, so stop the previous one early
+        if self.current_viz_worker is not None:
+            self.current_viz_worker.cancel()
+        self.current_viz_worker = worker
 
         # Start worker
-        worker.start()
+        self.thread_pool.start(worker)
 
-    def update_visualization(self, result):
+    def update_visualization(self, result, viz_key=None):
         """Update visualization in tooltip"""
         if not result:
             return
+        self.schedule_cleanup()
 
         viz_buffer, viz_type = result
+        if viz_buffer is None:
+            return
+
+        width = self.tooltip.viz_display.width()
+        height = self.tooltip.viz_display.height()
+        self._viz_request_id += 1
+
+        # Waveform envelopes are cheap to paint directly, at the display size so
+        # there is no second full-size pixmap to scale down
+        if viz_type == "Waveform":
+            size = QSize(WAVEFORM_RENDER_WIDTH, WAVEFORM_RENDER_HEIGHT)
+            if width > 0 and height > 0:
+                size = size.scaled(width, height, Qt.KeepAspectRatio)
+            pixmap = self._render_waveform_pixmap(viz_buffer, size.width(), size.height())
+            self._show_visualization(pixmap, viz_type, viz_key)
+            return
 
-        # Update tooltip visualization
-        if viz_buffer:
-            pixmap = QPixmap()
-            pixmap.loadFromData(viz_buffer.getvalue())
-            self.tooltip.viz_display.setPixmap(pixmap.scaled(
-                self.tooltip.viz_display.width(),
-                self.tooltip.viz_display.height(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            ))
-            self.tooltip.viz_combo_menu.setText(viz_type)
-            self.tooltip._change_visualization(viz_type)  # Update description
-            self.tooltip._viz_generated = True  # Mark visualization as explicitly generated
+        # Reuse a previous decode of the same image at the same size
+        data = viz_buffer.getvalue()
+        key = (hashlib.blake2b(data, digest_size=8).digest(), width, height)
+        pixmap = self._scaled_pixmap_cache.get(key)
+        if pixmap is not None:
+            self._scaled_pixmap_cache.move_to_end(key)
+            self._show_visualization(pixmap, viz_type, viz_key)
+            return
+
+        # Decode and scale the PNG in the worker pool, off the UI thread
+        worker = ImageDecodeWorker(data, width, height)
+        worker.finished.connect(partial(
+            self._on_visualization_decoded, self._viz_request_id, key, viz_type, viz_key))
+        worker.error.connect(self.handle_worker_error)
+        self.thread_pool.start(worker)
+
+    def _on_visualization_decoded(self, request_id, key, viz_type, viz_key, image):
+        """Convert a decoded QImage to a pixmap and show it (UI thread)"""
+        pixmap = QPixmap.fromImage(image)
+        self._scaled_pixmap_cache[key] = pixmap
+        while len(self._scaled_pixmap_cache) > PIXMAP_CACHE_SIZE:
+            self._scaled_pixmap_cache.popitem(last=False)
+
+        # Ignore results superseded by a newer visualization request
+        if request_id == self._viz_request_id:
+            self._show_visualization(pixmap, viz_type, viz_key)
+
+    def _show_visualization(self, pixmap, viz_type, viz_key=None):
+        """Display a ready-to-show visualization pixmap in the tooltip"""
+        if viz_key is not None:
+            self._viz_pixmap_cache[viz_key] = pixmap
+            self._viz_pixmap_cache.move_to_end(viz_key)
+            while len(self._viz_pixmap_cache) > PIXMAP_CACHE_SIZE:
+                self._viz_pixmap_cache.popitem(last=False)
+
+        self.tooltip.viz_display.setPixmap(pixmap)
+        self.tooltip.viz_combo_menu.setText(viz_type)
+        self.tooltip._change_visualization(viz_type)  # Update description
+        self.tooltip._viz_generated = True  # Mark visualization as explicitly generated
+
+    def _render_waveform_pixmap(self, envelope, width=WAVEFORM_RENDER_WIDTH,
+                                height=WAVEFORM_RENDER_HEIGHT):
+        """Draw a min/max waveform envelope onto a QPixmap"""
+        pixmap = QPixmap(width, height)
+        pixmap.fill(QColor(255, 255, 255))
+
+        painter = QPainter(pixmap)
+        mid = height / 2.0
+        # Keep the same headroom as the matplotlib plot (ylim of +/-1.1)
+        scale = mid / 1.1
+
+        # Zero line
+        painter.setPen(QPen(QColor(204, 204, 204), 1, Qt.DashLine))
+        painter.drawLine(QLineF(0, mid, width, mid))
+
+        # One vertical segment per envelope column
+        column_width = width / len(envelope)
+        painter.setPen(QPen(QColor(52, 101, 164), 1))
+        painter.drawLines([
+            QLineF(i * column_width, mid - hi * scale, i * column_width, mid - lo * scale)
+            for i, (lo, hi) in enumerate(envelope.tolist())
+        ])
+        painter.end()
+
+        return pixmap
 
     def handle_worker_error(self, error_message):
         """Handle worker thread errors"""
@@ -1086,6 +1483,32 @@ class AudioTooltipApp(QWidget):
             f"An error occurred while analyzing the audio file:\n{error_message}"
         )
 
+    def handle_invalid_file(self, error_message):
+        """Handle a file rejected by validation before analysis"""
+        self.module_logger.error(f"Invalid audio file: {error_message}")
+        self.hideProgressSignal.emit()
+
+        QMessageBox.warning(
+            None,
+            "Invalid Audio File",
+            f"Cannot analyze this file:\n{error_message}"
+        )
+
+    def _available_screen_rect(self):
+        """Return the primary screen's available geometry, cached until it changes"""
+        if self._screen_rect is None:
+            self._screen_rect = QApplication.primaryScreen().availableGeometry()
+        return self._screen_rect
+
+    def _invalidate_screen_cache(self, _arg=None):
+        """Drop the cached screen geometry after a monitor change"""
+        self._screen_rect = None
+
+    def _on_screen_added(self, screen):
+        """Watch a newly connected monitor's work area"""
+        screen.availableGeometryChanged.connect(self._invalidate_screen_cache)
+        self._screen_rect = None
+
     def show_tooltip_slot(self, result):
         """Show tooltip with analysis results"""
         if not result:
@@ -1093,39 +1516,22 @@ class AudioTooltipApp(QWidget):
             return
 
         try:
-            # Unpack result with format handling
-            if len(result) >= 7:  # New format with time_delay
-                file_path, metadata, viz_buffer, transcription, num_channels, channel, time_delay = result
-            elif len(result) == 6:  # Format with channel but no time_delay
-                file_path, metadata, viz_buffer, transcription, num_channels, channel = result
-                time_delay = None
-            else:  # Oldest format
-                file_path, metadata, viz_buffer, transcription, num_channels = result
-                channel, time_delay = 0, None
-
-            # Update tooltip content with time_delay if available
-            if time_delay is not None:
-                self.tooltip.update_content(
-                    file_path,
-                    metadata,
-                    viz_buffer,
-                    transcription,
-                    num_channels,
-                    channel,
-                    time_delay
-                )
-            else:
-                self.tooltip.update_content(
-                    file_path,
-                    metadata,
-                    viz_buffer,
-                    transcription,
-                    num_channels,
-                    channel
-                )
+            file_path, metadata, viz_buffer, transcription, num_channels, channel, time_delay = \
+                _unpack_result(result)
+
+            # Update tooltip content (a None time_delay shows as "not detected")
+            self.tooltip.update_content(
+                file_path,
+                metadata,
+                viz_buffer,
+                transcription,
+                num_channels,
+                channel,
+                time_delay
+            )
 
             # Get available screen geometry
-            screen_rect = QApplication.primaryScreen().availableGeometry()
+            screen_rect = self._available_screen_rect()
 
             # Set a reasonable size constraint
             max_width = min(screen_rect.width() - 100, 1600)
@@ -1163,24 +1569,27 @@ class AudioTooltipApp(QWidget):
         # Show progress dialog
         self.showProgressSignal.emit("Transcribing audio...")
 
-        # Run in a worker thread
+        # Run in the worker pool
         worker = TranscriptionWorker(
             self.audio_analyzer, file_path, channel, language, transcription_channel)
         worker.finished.connect(self.update_transcription)
         worker.error.connect(self.handle_worker_error)
-        worker.finished.connect(self._emit_hide_progress)
+        # Signal-to-signal connection; Qt drops the result argument
+        worker.finished.connect(self.hideProgressSignal)
+        worker.file_saved.connect(self.open_text_file)
         worker.file_saved.connect(
             self.show_file_saved_notification)
         worker.file_saved.connect(self.set_transcript_file_path)
-        worker.finished.connect(lambda _, w=worker: self._cleanup_list_worker(self.transcription_workers, w))
-
-        # Store worker reference
-        if not hasattr(self, "transcription_workers"):
-            self.transcription_workers = []
-        self.transcription_workers.append(worker)
 
         # Start worker
-        worker.start()
+        self.thread_pool.start(worker)
+
+    def open_text_file(self, file_path):
+        """Open a saved transcription in the default text editor"""
+        if QDesktopServices.openUrl(QUrl.fromLocalFile(file_path)):
+            self.module_logger.info(f"Opened transcription file: {file_path}")
+        else:
+            self.module_logger.error(f"Failed to open transcription file: {file_path}")
 
     def show_file_saved_notification(self, file_path):
         """Show notification that transcription file was saved"""
@@ -1195,6 +1604,7 @@ class AudioTooltipApp(QWidget):
         """Update transcription in tooltip"""
         if not transcription:
             return
+        self.schedule_cleanup()
 
         # Update tooltip transcription
         self.tooltip.transcript_text.setText(transcription)
@@ -1207,190 +1617,336 @@ class AudioTooltipApp(QWidget):
         self.tooltip.transcript_file_path = file_path
         self.tooltip.view_transcript_button.setEnabled(True)
 
+    def _visible_windows_z_order(self, foreground_hwnd):
+        """Return visible top-level HWNDs in z-order, cached briefly.
+
+        The cache is reused for EXPLORER_CACHE_TTL seconds as long as the
+        foreground window has not changed, so repeated triggers skip EnumWindows.
+        """
+        now = time.monotonic()
+        cache = self._explorer_cache
+        if cache and now - cache[0] < EXPLORER_CACHE_TTL and cache[1] == foreground_hwnd:
+            return cache[2]
+
+        def enum_windows_callback(hwnd, windows_list):
+            if win32gui.IsWindowVisible(hwnd):
+                windows_list.append(hwnd)
+
+        window_z_order = []
+        win32gui.EnumWindows(enum_windows_callback, window_z_order)
+        self._explorer_cache = (now, foreground_hwnd, window_z_order)
+        return window_z_order
+
+    def _selected_audio_paths(self, window):
+        """Yield existing audio files among the selected items of a Shell window"""
+        # One handler for the whole COM walk of this window
+        try:
+            selected = window.Document.SelectedItems()
+            if selected is None or selected.Count == 0:
+                return
+
+            # Read all paths in one COM pass via the collection enumerator
+            # (no indexed Item(j) calls), then filter in plain Python
+            paths = [item.Path for item in selected]
+        except Exception as sel_e:
+            # Views without selections (e.g. Control Panel) fail here too, but
+            # only a closed tab or window makes the cached map stale
+            self._invalidate_if_disconnected(sel_e)
+            self.module_logger.warning("Error getting selected items: %s", sel_e)
+            return
+
+        for file_path in paths:
+            if is_audio_file(file_path) and os.path.exists(file_path):
+                yield file_path
+
+    @staticmethod
+    def _explorer_hwnds():
+        """Top-level File Explorer HWNDs, found with Win32 calls only (no COM)"""
+        hwnds = []
+        for window_class in EXPLORER_WINDOW_CLASSES:
+            hwnd = 0
+            while True:
+                # pywin32 raises instead of returning 0 once nothing matches
+                try:
+                    hwnd = win32gui.FindWindowEx(0, hwnd, window_class, None)
+                except win32gui.error:
+                    break
+                if not hwnd:
+                    break
+                hwnds.append(hwnd)
+        return frozenset(hwnds)
+
+    def _shell_windows_by_hwnd(self):
+        """Return {HWND: [Shell windows]}, re-enumerated over COM only when the
+        open Explorer windows or the number of Shell windows have changed.
+
+        Explorer tabs (Windows 11) share their window's HWND, so one HWND can
+        map to several Shell windows; the count catches tabs opening or closing.
+        """
+        explorer_hwnds = self._explorer_hwnds()
+        if not explorer_hwnds:
+            self._shell_windows_cache = {}
+            self._shell_cache_key = (explorer_hwnds, 0)
+            return self._shell_windows_cache
+
+        try:
+            if self._shell_windows is None:
+                if self._shell_app is None:
+                    from win32com.client import Dispatch
+                    self._shell_app = Dispatch("Shell.Application")
+                self._shell_windows = self._shell_app.Windows()
+            count = self._shell_windows.Count
+        except Exception:
+            # E.g. Explorer restarted; create fresh objects next time
+            self._shell_app = None
+            self._shell_windows = None
+            self._shell_cache_key = None
+            raise
+
+        cache_key = (explorer_hwnds, count)
+        if cache_key == self._shell_cache_key:
+            return self._shell_windows_cache
+
+        shell_windows = {}
+        for i in range(count):
+            try:
+                window = self._shell_windows.Item(i)
+                if window is None:
+                    continue
+                shell_windows.setdefault(window.HWND, []).append(window)
+            except Exception:
+                continue
+        self.module_logger.debug("Found %s Shell windows", count)
+
+        self._shell_windows_cache = shell_windows
+        self._shell_cache_key = cache_key
+        return shell_windows
+
+    def _invalidate_if_disconnected(self, error):
+        """Drop the Shell window map if error comes from a closed window or tab"""
+        hresult = error.args[0] if error.args else None
+        if hresult in COM_DISCONNECTED_HRESULTS:
+            self._shell_cache_key = None
+
+    @staticmethod
+    def _active_tab_first(hwnd, windows):
+        """Order the Shell windows (tabs) sharing one HWND with the visible tab first.
+
+        The frame's title follows the active tab, so a tab whose location name
+        matches it is the one the user is looking at.
+        """
+        if len(windows) < 2:
+            return windows
+        try:
+            title = win32gui.GetWindowText(hwnd)
+        except Exception:
+            return windows
+
+        def is_active(window):
+            try:
+                name = window.LocationName
+            except Exception:
+                return False
+            return bool(name) and (title == name or title.startswith(name + " - "))
+
+        # Stable sort keeps the enumeration order among the other tabs
+        return sorted(windows, key=lambda window: not is_active(window))
+
+    def _selected_audio_paths_in(self, hwnd, windows):
+        """Yield existing selected audio files from each Shell window (tab) of one HWND,
+        starting with the active tab"""
+        for window in self._active_tab_first(hwnd, windows):
+            yield from self._selected_audio_paths(window)
+
+    def _iter_explorer_audio_paths(self, shell_by_hwnd, foreground_hwnd):
+        """Yield candidate audio files from Explorer windows, best match first.
+
+        Order: selection in the foreground window, then in the window under
+        the cursor, then in the other windows in z-order, then the focused
+        item of each visible window.
+        """
+        from utils.mouse_utils import root_window_under_cursor
+
+        # --- Step 1: Probe the foreground Explorer window ---
+        probed = set()
+        if foreground_hwnd in shell_by_hwnd:
+            probed.add(foreground_hwnd)
+            yield from self._selected_audio_paths_in(
+                foreground_hwnd, shell_by_hwnd[foreground_hwnd])
+
+        # One hit-test instead of comparing the cursor against every window rect
+        try:
+            cursor_hwnd = root_window_under_cursor()
+        except Exception as cursor_e:
+            self.module_logger.debug("Error finding window under cursor: %s", cursor_e)
+            cursor_hwnd = None
+        if cursor_hwnd in shell_by_hwnd and cursor_hwnd not in probed:
+            probed.add(cursor_hwnd)
+            yield from self._selected_audio_paths_in(
+                cursor_hwnd, shell_by_hwnd[cursor_hwnd])
+
+        # --- Step 2: Check all Explorer windows in z-order ---
+        self.module_logger.info("Checking all Explorer windows in z-order")
+
+        # Map shell windows to z-order, then any remaining ones
+        window_z_order = self._visible_windows_z_order(foreground_hwnd)
+        shell_windows_by_z = [(hwnd, shell_by_hwnd[hwnd])
+                              for hwnd in window_z_order if hwnd in shell_by_hwnd]
+        z_ordered = {hwnd for hwnd, _ in shell_windows_by_z}
+        shell_windows_by_z.extend(
+            (hwnd, windows) for hwnd, windows in shell_by_hwnd.items() if hwnd not in z_ordered)
+
+        for hwnd, windows in shell_windows_by_z:
+            # Skip the windows we already checked
+            if hwnd in probed:
+                continue
+            yield from self._selected_audio_paths_in(hwnd, windows)
+
+        # --- Step 3: Try focused item fallback ---
+        self.module_logger.info("Trying focused items")
+        for _, windows in shell_windows_by_z:
+            for window in windows:
+                try:
+                    if window.Visible:
+                        focused = window.Document.FocusedItem
+                        if focused:
+                            file_path = focused.Path
+                            if is_audio_file(file_path) and os.path.exists(file_path):
+                                yield file_path
+                except Exception as focus_e:
+                    self._invalidate_if_disconnected(focus_e)
+
+    def _on_no_explorer_file(self):
+        """Detection found nothing in Explorer: fall back to the clipboard.
+
+        Runs on the UI thread, which owns QClipboard and the OLE (STA)
+        apartment that reading Explorer's copied file list requires.
+        """
+        clipboard_path = self._clipboard_audio_path()
+        if clipboard_path:
+            self.analyze_file(clipboard_path)
+            return
+
+        self.module_logger.info("No audio files found in any window")
+        self.show_no_file_message()
+
+    def show_no_file_message(self):
+        """Tell the user that detection found no audio file"""
+        self.tray_icon.showMessage(
+            "Audio Tooltip",
+            "No audio file selected. Please select an audio file in Explorer.",
+            QSystemTrayIcon.Information,
+            3000
+        )
+
+    def _clipboard_audio_path(self):
+        """Return an existing audio file path from the clipboard, or None"""
+        self.module_logger.info("Trying clipboard for file path")
+        try:
+            # Files copied in Explorer are on the clipboard as URLs, not text
+            mime_data = QApplication.clipboard().mimeData()
+            if mime_data.hasUrls():
+                clipboard_paths = [url.toLocalFile() for url in mime_data.urls()
+                                   if url.isLocalFile()]
+            elif mime_data.hasText():
+                text = mime_data.text()
+                # Skip copied documents without stripping or parsing them
+                clipboard_paths = [text.strip()] if len(text) <= MAX_CLIPBOARD_PATH_LENGTH else []
+            else:
+                clipboard_paths = []
+
+            for clipboard_path in clipboard_paths:
+                if is_audio_file(clipboard_path) and os.path.exists(clipboard_path):
+                    self.module_logger.info("Found audio file in clipboard: %s", clipboard_path)
+                    return clipboard_path
+        except Exception as clip_e:
+            self.module_logger.error("Error checking clipboard: %s", clip_e)
+        return None
+
     def check_file_under_cursor(self):
         """Detect selected audio file in Explorer windows.
 
         Checks foreground window first, then all Explorer windows in z-order,
-        then focused items, and finally the clipboard as a last resort.
+        then focused items. When nothing is found, the UI thread checks the
+        clipboard as a last resort.
         """
+        log = self.module_logger
         if not WINDOWS_API_AVAILABLE:
-            self.module_logger.error("Cannot detect files: Windows API unavailable")
+            log.error("Cannot detect files: Windows API unavailable")
             with self._detection_lock:
                 self.detection_active = False
             return False
 
-        self.module_logger.info("Starting audio file detection")
+        log.debug("Starting audio file detection")
 
         try:
-            # Initialize COM for this thread
-            try:
-                pythoncom.CoInitializeEx(0)
-            except Exception as com_e:
-                self.module_logger.warning(f"COM initialization error: {com_e}")
-
             # Get foreground window info
             foreground_hwnd = None
             try:
                 foreground_hwnd = win32gui.GetForegroundWindow()
-                self.module_logger.info(
-                    f"Foreground window: {win32gui.GetWindowText(foreground_hwnd)}, HWND: {foreground_hwnd}")
+                if log.isEnabledFor(logging.INFO):
+                    log.info(
+                        "Foreground window: %s, HWND: %s",
+                        win32gui.GetWindowText(foreground_hwnd), foreground_hwnd)
             except Exception as fg_e:
-                self.module_logger.warning(f"Error getting foreground window: {fg_e}")
+                log.warning("Error getting foreground window: %s", fg_e)
 
             try:
-                shell = Dispatch("Shell.Application")
-                windows = shell.Windows()
-                self.module_logger.debug(f"Found {windows.Count} Explorer windows")
-
-                found_file = False
-                foreground_explorer = None
-
-                # --- Step 1: Match foreground window to a Shell window ---
-                if foreground_hwnd:
-                    for i in range(windows.Count):
-                        try:
-                            window = windows.Item(i)
-                            if window is None:
-                                continue
-                            try:
-                                if window.HWND == foreground_hwnd:
-                                    foreground_explorer = window
-                                    break
-                            except Exception:
-                                pass
-                        except Exception:
-                            pass
-
-                # --- Step 2: Check foreground Explorer window ---
-                if foreground_explorer:
-                    try:
-                        selected = foreground_explorer.Document.SelectedItems()
-                        if selected and selected.Count > 0:
-                            for j in range(selected.Count):
-                                try:
-                                    file_path = selected.Item(j).Path
-                                    if is_audio_file(file_path) and os.path.exists(file_path):
-                                        self.module_logger.info(f"Audio file in foreground: {file_path}")
-                                        self.file_detected_signal.emit(file_path)
-                                        return True
-                                except Exception as item_e:
-                                    self.module_logger.warning(f"Error processing selected item: {item_e}")
-                    except Exception as sel_e:
-                        self.module_logger.warning(f"Error getting selected items from foreground: {sel_e}")
-
-                # --- Step 3: Check all Explorer windows in z-order ---
-                self.module_logger.info("Checking all Explorer windows in z-order")
-
-                def enum_windows_callback(hwnd, windows_list):
-                    if win32gui.IsWindowVisible(hwnd):
-                        windows_list.append(hwnd)
-
-                window_z_order = []
-                win32gui.EnumWindows(enum_windows_callback, window_z_order)
-
-                # Map shell windows to z-order
-                shell_windows_by_z = []
-                for hwnd in window_z_order:
-                    for i in range(windows.Count):
-                        try:
-                            window = windows.Item(i)
-                            if window and window.HWND == hwnd:
-                                shell_windows_by_z.append(window)
-                                break
-                        except Exception:
-                            pass
-
-                # Add any remaining shell windows not matched by z-order
-                for i in range(windows.Count):
-                    try:
-                        window = windows.Item(i)
-                        if window and window not in shell_windows_by_z:
-                            shell_windows_by_z.append(window)
-                    except Exception:
-                        pass
-
-                # Check selected items in each window (z-order, top to bottom)
-                for window in shell_windows_by_z:
-                    try:
-                        # Skip the foreground window we already checked
-                        if foreground_explorer and window.HWND == foreground_explorer.HWND:
-                            continue
-
-                        try:
-                            selected = window.Document.SelectedItems()
-                            if selected is None or selected.Count == 0:
-                                continue
-
-                            for j in range(selected.Count):
-                                try:
-                                    file_path = selected.Item(j).Path
-                                    if is_audio_file(file_path) and os.path.exists(file_path):
-                                        self.module_logger.info(f"Audio file detected: {file_path}")
-                                        self.file_detected_signal.emit(file_path)
-                                        return True
-                                except Exception as item_e:
-                                    self.module_logger.warning(f"Error processing item: {item_e}")
-                        except Exception as sel_e:
-                            self.module_logger.warning(f"Error getting selected items: {sel_e}")
-                    except Exception as window_e:
-                        self.module_logger.warning(f"Error processing window: {window_e}")
-
-                # --- Step 4: Try focused item fallback ---
-                self.module_logger.info("Trying focused items")
-                for window in shell_windows_by_z:
-                    try:
-                        if window.Visible:
-                            try:
-                                focused = window.Document.FocusedItem
-                                if focused:
-                                    file_path = focused.Path
-                                    if is_audio_file(file_path) and os.path.exists(file_path):
-                                        self.module_logger.info(f"Audio file detected (focused): {file_path}")
-                                        self.file_detected_signal.emit(file_path)
-                                        return True
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-
-                # --- Step 5: Try clipboard ---
-                self.module_logger.info("Trying clipboard for file path")
-                try:
-                    clipboard = QApplication.clipboard()
-                    clipboard_text = clipboard.text()
-                    if clipboard_text and os.path.exists(clipboard_text) and is_audio_file(clipboard_text):
-                        self.module_logger.info(f"Found audio file in clipboard: {clipboard_text}")
-                        self.file_detected_signal.emit(clipboard_text)
+                # Empty without any COM call when no Explorer window is open
+                shell_by_hwnd = self._shell_windows_by_hwnd()
+                if shell_by_hwnd:
+                    # The generator is lazy, so later windows are never probed once a file is found
+                    for file_path in self._iter_explorer_audio_paths(shell_by_hwnd, foreground_hwnd):
+                        log.info("Audio file detected: %s", file_path)
+                        self.file_detected_signal.emit(file_path)
                         return True
-                except Exception as clip_e:
-                    self.module_logger.error(f"Error checking clipboard: {clip_e}")
-
-                # Nothing found
-                self.module_logger.info("No audio files found in any window")
-                self.tray_icon.showMessage(
-                    "Audio Tooltip",
-                    "No audio file selected. Please select an audio file in Explorer.",
-                    QSystemTrayIcon.Information,
-                    3000
-                )
-                return False
-
+                else:
+                    log.info("No Explorer window open, skipping Shell enumeration")
             except Exception as shell_e:
-                self.module_logger.error(f"Shell API error: {shell_e}")
-                self.module_logger.error(traceback.format_exc())
+                # Tracebacks are only formatted when debug logging is on
+                log.error(
+                    "Shell API error: %s", shell_e,
+                    exc_info=log.isEnabledFor(logging.DEBUG))
                 return False
 
+            # --- Step 4: Try clipboard (on the UI thread) ---
+            self.no_file_detected_signal.emit()
+            return False
+
         except Exception as e:
-            self.module_logger.error(f"Error in audio file detection: {e}")
-            self.module_logger.error(traceback.format_exc())
+            log.error(
+                "Error in audio file detection: %s", e,
+                exc_info=log.isEnabledFor(logging.DEBUG))
             return False
         finally:
             with self._detection_lock:
                 self.detection_active = False
-            try:
+
+    def _detection_loop(self):
+        """Run queued detection requests on one thread with a persistent COM apartment"""
+        pythoncom = None
+        com_initialized = False
+        try:
+            # A None item is the shutdown sentinel
+            while self._detection_queue.get() is not None:
+                # Load and initialize COM only once detection actually fires
+                if WINDOWS_API_AVAILABLE and pythoncom is None:
+                    import pythoncom
+                    try:
+                        pythoncom.CoInitializeEx(0)
+                        com_initialized = True
+                    except Exception as com_e:
+                        self.module_logger.warning(f"COM initialization error: {com_e}")
+                self.check_file_under_cursor()
+        finally:
+            # Release cached Shell proxies inside the apartment that created them
+            self._shell_app = None
+            self._shell_windows = None
+            self._shell_windows_cache = {}
+            self._shell_cache_key = None
+            # Only balance a successful CoInitializeEx
+            if com_initialized:
                 pythoncom.CoUninitialize()
-            except Exception:
-                pass
 
     def track_input(self):
         # Require at least one input facility: Windows API (mouse) or keyboard hooks
@@ -1402,19 +1958,21 @@ class AudioTooltipApp(QWidget):
 
         def on_hotkey():
             # Triggered by keyboard hotkey (Alt+A). Use same behavior as right-click gesture.
+            now = time.monotonic()
+            with self._detection_lock:
+                if self.detection_active or now - self._last_hotkey_ts < HOTKEY_DEBOUNCE_SECONDS:
+                    return
+                self._last_hotkey_ts = now
+                self.detection_active = True
+            self._detection_queue.put(True)
+
+        def on_middle_click():
+            self.module_logger.debug("Middle click detected")
             with self._detection_lock:
                 if self.detection_active:
                     return
                 self.detection_active = True
-            try:
-                detection_thread = threading.Thread(target=self.check_file_under_cursor)
-                detection_thread.daemon = True
-                detection_thread.start()
-            except Exception as e:
-                self.module_logger.error(f"Error in hotkey handler: {e}")
-                self.module_logger.error(traceback.format_exc())
-                with self._detection_lock:
-                    self.detection_active = False
+            self._detection_queue.put(True)
 
         # Try to register the keyboard hotkey if available
         if KEYBOARD_AVAILABLE:
@@ -1428,47 +1986,51 @@ class AudioTooltipApp(QWidget):
             except Exception as reg_e:
                 self.module_logger.error(f"Failed to register hotkey: {reg_e}")
 
-        # Poll middle mouse button (single click) using Win32 API if available
+        # Without the Win32 API there is nothing to poll: keyboard hooks run on
+        # their own thread, so just block until shutdown
+        if not WINDOWS_API_AVAILABLE:
+            self._shutdown_event.wait()
+            self.module_logger.info("Input tracking thread terminated")
+            return
+
+        # Prefer a low-level mouse hook: the thread sleeps in GetMessage and
+        # only a middle button press does any work, instead of waking up to
+        # poll. The hook runs on_middle_click() inline, which must stay quick.
+        try:
+            from utils.mouse_utils import MiddleClickListener
+            self._middle_click_listener = MiddleClickListener(on_middle_click)
+            # close_app() may have run before the listener was published
+            if self._shutdown_event.is_set():
+                self._middle_click_listener.stop()
+            if self._middle_click_listener.run():
+                self.module_logger.info("Input tracking thread terminated")
+                return
+        except Exception as e:
+            self.module_logger.warning(f"Mouse hook unavailable, polling mouse instead: {e}")
+        self._middle_click_listener = None
+
+        # Fallback: poll middle mouse button (single click) using Win32 API
         middle_button_prev = False
 
         while self.running:
             try:
-                # Poll middle mouse button (single click) using Win32 API if available
-                if WINDOWS_API_AVAILABLE:
-                    try:
-                        state = win32api.GetAsyncKeyState(0x04)  # VK_MBUTTON
-                        mouse_down = (state & 0x8000) != 0
-                        # Detect edge from up -> down to debounce (one trigger per physical click)
-                        if mouse_down and not middle_button_prev:
-                            self.module_logger.debug("Middle click detected")
-                            with self._detection_lock:
-                                if self.detection_active:
-                                    middle_button_prev = mouse_down
-                                    continue
-                                self.detection_active = True
-                            try:
-                                detection_thread = threading.Thread(target=self.check_file_under_cursor)
-                                detection_thread.daemon = True
-                                detection_thread.start()
-                            except Exception as e:
-                                self.module_logger.error(f"Error starting detection thread: {e}")
-                                with self._detection_lock:
-                                    self.detection_active = False
-                        middle_button_prev = mouse_down
-                    except Exception as mouse_e:
-                        self.module_logger.debug(f"Mouse polling error: {mouse_e}")
-
-                # Sleep briefly to avoid busy loop
                 try:
-                    time.sleep(0.05)
-                except Exception as sleep_e:
-                    self.module_logger.error(f"Error in input tracking sleep: {sleep_e}")
-                    time.sleep(0.5)
+                    state = win32api.GetAsyncKeyState(0x04)  # VK_MBUTTON
+                    mouse_down = (state & 0x8000) != 0
+                    # Detect edge from up -> down to debounce (one trigger per physical click)
+                    if mouse_down and not middle_button_prev:
+                        on_middle_click()
+                    middle_button_prev = mouse_down
+                except Exception as mouse_e:
+                    self.module_logger.debug(f"Mouse polling error: {mouse_e}")
+
+                # Wait briefly between polls; returns immediately on shutdown
+                self._shutdown_event.wait(MOUSE_POLL_INTERVAL)
 
             except Exception as e:
                 self.module_logger.error(f"Error in input tracking main loop: {e}")
                 self.module_logger.error(traceback.format_exc())
-                time.sleep(0.5)
+                self._shutdown_event.wait(0.5)
 
         self.module_logger.info("Input tracking thread terminated")
 
@@ -1479,14 +2041,16 @@ class AudioTooltipApp(QWidget):
             if self.detection_active:
                 return
             self.detection_active = True
-        try:
-            detection_thread = threading.Thread(target=self.check_file_under_cursor)
-            detection_thread.daemon = True
-            detection_thread.start()
-        except Exception as e:
-            self.module_logger.error(f"Error starting detection thread: {e}")
-            with self._detection_lock:
-                self.detection_active = False
+        self._detection_queue.put(True)
+
+
+def _make_app():
+    """Create the QApplication with the app-wide settings"""
+    app = QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)  # Keep running when windows close
+    app.setApplicationName("Audio Tooltip")
+    app.setOrganizationName("MCDE - FHL 2025")
+    return app
 
 
 def finish_startup_sequence(splash, tooltip_app):
@@ -1497,48 +2061,139 @@ def finish_startup_sequence(splash, tooltip_app):
     QTimer.singleShot(500, tooltip_app.show_help_notification)
 
 
+def _splash_cache_path():
+    """Path of the cached splash image; the version in the name invalidates it on upgrade"""
+    if os.name == 'nt':  # Windows
+        base_dir = os.path.expanduser("~\\AppData\\Local")
+    else:  # Linux/Mac
+        base_dir = os.path.expanduser("~/.local/share")
+    version = SPLASH_VERSION_TEXT.split(" ", 1)[0]
+    return os.path.join(base_dir, "AudioTooltip", f"splash_{version}.png")
+
+
+@lru_cache(maxsize=None)
+def _splash_fonts():
+    """Title, version and loading-message fonts, resolved once per process"""
+    return QFont("Arial", 24, QFont.Bold), QFont("Arial", 12), QFont("Arial", 14)
+
+
+def _render_splash_pixmap():
+    """Paint the splash screen image"""
+    splash_pixmap = QPixmap(500, 300)
+    splash_pixmap.fill(QColor(50, 50, 80))  # Dark blue background
+
+    # Draw content on the pixmap
+    painter = QPainter(splash_pixmap)
+    try:
+        # Only text benefits from antialiasing; the rest is axis-aligned fills
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        title_font, version_font, loading_font = _splash_fonts()
+
+        # Title
+        painter.setFont(title_font)
+        painter.setPen(QColor(255, 255, 255))  # White text
+        painter.drawText(20, 50, "Audio Tooltip")
+
+        # Version
+        painter.setFont(version_font)
+        painter.setPen(QColor(200, 200, 200))  # Light gray
+        painter.drawText(20, 80, SPLASH_VERSION_TEXT)
+
+        # Loading message
+        painter.setFont(loading_font)
+        painter.setPen(QColor(100, 150, 255))  # Light blue
+        painter.drawText(20, 220, "Loading components...")
+
+        # Progress bar visual: 1px frame, 1px gap, then the bar, all as plain fills
+        bar_color = QColor(100, 150, 255)
+        painter.fillRect(20, 240, 461, 21, bar_color)
+        painter.fillRect(21, 241, 459, 19, QColor(50, 50, 80))
+        painter.fillRect(22, 242, 456, 16, bar_color)
+    finally:
+        # End even if a draw call raises, so the painter never outlives the paint
+        painter.end()
+    return splash_pixmap
+
+
+def _load_splash_pixmap():
+    """Load the splash image: the one baked into release builds, else the
+    per-user cache, painting and caching it on first launch"""
+    if _SPLASH_RESOURCE is not None:
+        splash_pixmap = QPixmap(_SPLASH_RESOURCE)
+        if not splash_pixmap.isNull():
+            return splash_pixmap
+
+    cache_path = _splash_cache_path()
+    splash_pixmap = QPixmap(cache_path)
+    if not splash_pixmap.isNull():
+        return splash_pixmap
+
+    splash_pixmap = _render_splash_pixmap()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        splash_pixmap.save(cache_path, "PNG")
+    except OSError:
+        pass  # Caching is best effort; the painted pixmap is still used
+    return splash_pixmap
+
+
 def main(app=None, splash=None, args=None):
     """Main application entry point"""
     
     # Handle startup/minimized mode
     startup_mode = args and (args.startup or args.minimized) if args else False
+    splash_shown_at = time.monotonic()
 
     try:
         # If app wasn't provided, create it (for backward compatibility)
         if app is None:
-            app = QApplication(sys.argv)
-            app.setQuitOnLastWindowClosed(False)
-            app.setApplicationName("Audio Tooltip")
-            app.setOrganizationName("MCDE - FHL 2025")
+            app = _make_app()
 
         # Update splash message if splash exists
         if splash:
             splash.showMessage("Initializing components...",
                                Qt.AlignBottom | Qt.AlignCenter, QColor(255, 255, 255))
-            app.processEvents()
-            # Add a small delay to make splash more visible
-            QTimer.singleShot(1500, lambda: None)
-            app.processEvents()
 
-        # Update splash for app creation
-        if splash:
-            splash.showMessage("Creating application...",
-                               Qt.AlignBottom | Qt.AlignCenter, QColor(255, 255, 255))
-            app.processEvents()
+        tooltip_app = None
 
-        # Create main app with explicit error handling
-        tooltip_app = AudioTooltipApp(startup_mode=startup_mode)
+        def close_splash():
+            """Close the splash now, or once it has been visible for the minimum time"""
+            elapsed_ms = (time.monotonic() - splash_shown_at) * 1000
+            remaining_ms = max(0, SPLASH_MIN_VISIBLE_MS - elapsed_ms)
+            QTimer.singleShot(int(remaining_ms),
+                              lambda: finish_startup_sequence(splash, tooltip_app))
 
-        # Update splash for final step and always show instructions
-        if splash:
-            splash.showMessage("Starting services...",
-                               Qt.AlignBottom | Qt.AlignCenter, QColor(255, 255, 255))
-            app.processEvents()
-            # Keep splash visible a bit longer, then show instructions
-            QTimer.singleShot(2000, lambda: finish_startup_sequence(splash, tooltip_app))
-        else:
-            # Show instructions immediately if no splash
-            QTimer.singleShot(1000, tooltip_app.show_help_notification)
+        def init_app():
+            """Create the main app once the event loop has painted the splash"""
+            nonlocal tooltip_app
+            try:
+                # Update splash for app creation
+                if splash:
+                    splash.showMessage("Creating application...",
+                                       Qt.AlignBottom | Qt.AlignCenter, QColor(255, 255, 255))
+
+                # Create main app with explicit error handling
+                tooltip_app = AudioTooltipApp(startup_mode=startup_mode)
+
+                # Flush queued log records before the process exits
+                app.aboutToQuit.connect(shutdown_logging)
+
+                # Update splash for final step and always show instructions
+                if splash:
+                    splash.showMessage("Starting services...",
+                                       Qt.AlignBottom | Qt.AlignCenter, QColor(255, 255, 255))
+                    # Close the splash once background initialization completes
+                    tooltip_app.initialized.connect(close_splash)
+                else:
+                    # Show instructions immediately if no splash
+                    QTimer.singleShot(1000, tooltip_app.show_help_notification)
+            except Exception as e:
+                logging.getLogger("AudioTooltipApp").critical(f"Error starting application: {e}", exc_info=True)
+                if splash:
+                    splash.finish(None)
+                app.exit(1)
+
+        QTimer.singleShot(0, init_app)
 
         # Start the event loop
         return app.exec_()
@@ -1559,54 +2214,17 @@ if __name__ == '__main__':
     args = parser.parse_args()
 
     # Create application first
-    app = QApplication(sys.argv)
-
-    app.setQuitOnLastWindowClosed(False)  # Keep running when windows close
-    app.setApplicationName("Audio Tooltip")
-    app.setOrganizationName("MCDE - FHL 2025")
+    app = _make_app()
 
     # Always create and show splash screen
-    splash_pixmap = QPixmap(500, 300)
-    splash_pixmap.fill(QColor(50, 50, 80))  # Dark blue background
-
-    # Draw content on the pixmap
-    painter = QPainter(splash_pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-    painter.setRenderHint(QPainter.TextAntialiasing)
-    
-    # Title
-    title_font = QFont("Arial", 24, QFont.Bold)
-    painter.setFont(title_font)
-    painter.setPen(QColor(255, 255, 255))  # White text
-    painter.drawText(20, 50, "Audio Tooltip")
-    
-    # Version
-    version_font = QFont("Arial", 12)
-    painter.setFont(version_font)
-    painter.setPen(QColor(200, 200, 200))  # Light gray
-    painter.drawText(20, 80, "v3.0.5 - Audio Analysis Tool")
-    
-    # Loading message
-    loading_font = QFont("Arial", 14)
-    painter.setFont(loading_font)
-    painter.setPen(QColor(100, 150, 255))  # Light blue
-    painter.drawText(20, 220, "Loading components...")
-    
-    # Progress bar visual
-    painter.setPen(QColor(100, 150, 255))
-    painter.drawRect(20, 240, 460, 20)
-    painter.fillRect(22, 242, 456, 16, QColor(100, 150, 255))
-    
-    painter.end()
+    splash_pixmap = _load_splash_pixmap()
 
     # Create splash screen using the painted pixmap
-    splash = QSplashScreen(splash_pixmap)
-    splash.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.SplashScreen)
+    splash = QSplashScreen(splash_pixmap, Qt.WindowStaysOnTopHint | Qt.SplashScreen)
     splash.show()
-    app.processEvents()
 
-    # Close the PyInstaller native splash now that the Qt splash is visible
+    # Close the PyInstaller native splash once the Qt splash has been painted
     if pyi_splash is not None:
-        pyi_splash.close()
+        QTimer.singleShot(0, pyi_splash.close)
 
     sys.exit(main(app, splash, args))
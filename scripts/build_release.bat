@@ -111,6 +111,24 @@ if errorlevel 1 (
 )
 echo.
 
+REM ── 7b. Compile Qt resources ─────────────────────────────────────────────────
+echo [INFO] Pre-rendering splash screen...
+python scripts\render_splash.py
+if errorlevel 1 (
+    echo [ERROR] Failed to render the splash screen.
+    pause
+    exit /b 1
+)
+echo [INFO] Compiling Qt resources...
+pyrcc5 resources.qrc -o resources_rc.py
+if errorlevel 1 (
+    echo [ERROR] Failed to compile resources.qrc.
+    pause
+    exit /b 1
+)
+echo [OK] resources_rc.py generated.
+echo.
+
 REM ── 8. Clean previous build artifacts ────────────────────────────────────────
 echo [INFO] Cleaning previous build...
 if exist "dist"  rmdir /s /q "dist"
@@ -0,0 +1,37 @@
+"""
+Build helper: pre-render the Qt splash screen for the current version.
+
+Usage:
+    python scripts/render_splash.py
+        Paints the splash with main._render_splash_pixmap() and saves it to
+        resources/qt_splash.png, which resources.qrc bundles as
+        :/splash/splash.png. Run after patching the version, before pyrcc5.
+        Exits 0 on success, 1 on failure.
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_PNG = os.path.join(ROOT_DIR, "resources", "qt_splash.png")
+
+
+def render_splash():
+    sys.path.insert(0, ROOT_DIR)
+    try:
+        from PyQt5.QtWidgets import QApplication
+        import main
+
+        app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841 - needed for fonts
+        if not main._render_splash_pixmap().save(OUTPUT_PNG, "PNG"):
+            print(f"ERROR: Could not write {OUTPUT_PNG}", file=sys.stderr)
+            return 1
+        print(OUTPUT_PNG)
+        return 0
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(render_splash())
@@ -162,9 +162,14 @@ class SettingsDialog(QDialog):
         self.startup_check.setChecked(True)
         self.startup_check.stateChanged.connect(self._toggle_startup)
 
+        # Qt's own dialog avoids slow shell-extension icon/thumbnail lookups
+        self.native_dialog_check = QCheckBox("Use the system file dialog")
+        self.native_dialog_check.setChecked(False)
+
         interface_layout.addRow("", self.auto_close_check)
         interface_layout.addRow("Auto-close after:", self.auto_close_time_spin)
         interface_layout.addRow("", self.startup_check)
+        interface_layout.addRow("", self.native_dialog_check)
 
         # Add to layout
         layout.addWidget(interface_group)
@@ -516,6 +521,9 @@ class SettingsDialog(QDialog):
         
         self.startup_check.setChecked(saved_startup)
 
+        self.native_dialog_check.setChecked(
+            self.settings.value("native_file_dialog", "false") == "true")
+
         # Load logging setting (default: disabled)
         logging_enabled = self.settings.value("enable_logging", "false") == "true"
         self.enable_logging_check.setChecked(logging_enabled)
@@ -527,6 +535,8 @@ class SettingsDialog(QDialog):
             "auto_close", "true" if self.auto_close_check.isChecked() else "false")
         self.settings.setValue("auto_close_time", str(
             self.auto_close_time_spin.value()))
+        self.settings.setValue(
+            "native_file_dialog", "true" if self.native_dialog_check.isChecked() else "false")
 
         # Analysis settings
         self.settings.setValue("preview_duration", str(
@@ -6,7 +6,7 @@ Provides a customizable tooltip for displaying audio analysis results.
 
 import os
 import subprocess
-from PyQt5.QtGui import QPixmap, QFont, QIcon, QPainter, QColor, QPen, QCursor
+from PyQt5.QtGui import QPixmap, QImage, QFont, QIcon, QPainter, QColor, QPen, QCursor
 from PyQt5.QtCore import Qt, QTimer, QSize, QPoint, QRect, QPropertyAnimation, QEasingCurve, QSettings
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTabWidget,
@@ -1092,15 +1092,16 @@ class EnhancedTooltip(QWidget):
 
         # Update waveform on overview tab
         if viz_buffer:
-            pixmap = QPixmap()
-            pixmap.loadFromData(viz_buffer.getvalue())
+            # Decode and scale as a QImage, converting only the final size to a
+            # pixmap instead of allocating a full-size intermediate QPixmap
+            image = QImage.fromData(viz_buffer.getvalue())
 
             # Calculate available width and scale appropriately
             available_width = self.waveform_label.width()
-            scaled_pixmap = pixmap.scaledToWidth(
+            scaled_pixmap = QPixmap.fromImage(image.scaledToWidth(
                 available_width,
                 Qt.SmoothTransformation
-            )
+            ))
 
             # Set the pixmap and center it
             self.waveform_label.setPixmap(scaled_pixmap)
@@ -1381,6 +1382,8 @@ class EnhancedTooltip(QWidget):
 
             # Get available width
             available_width = self.waveform_label.width()
+            if original_pixmap.width() == available_width:
+                return  # Already at this width; skip the smooth rescale
 
             # Scale to width while preserving aspect ratio
             scaled_pixmap = original_pixmap.scaledToWidth(
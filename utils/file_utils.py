@@ -6,18 +6,18 @@ Handles file operations, audio file detection, and recent files management.
 
 import os
 import json
+import stat
 import logging
-from pathlib import Path
-from typing import List, Set, Optional, Any
+from typing import List, FrozenSet, Optional, Any
 
 # Define logger
 logger = logging.getLogger("FileUtils")
 
-# Common audio file extensions
-AUDIO_EXTENSIONS: Set[str] = {
+# Common audio file extensions (lowercase, immutable for fast hashed lookups)
+AUDIO_EXTENSIONS: FrozenSet[str] = frozenset({
     '.mp3', '.wav', '.flac', '.m4a', '.ogg', '.wma',
     '.aac', '.aiff', '.mp4', '.ape', '.opus', '.wv'
-}
+})
 
 
 def is_audio_file(file_path: str) -> bool:
@@ -33,8 +33,8 @@ def is_audio_file(file_path: str) -> bool:
     if not file_path:
         return False
 
-    extension = Path(file_path).suffix.lower()
-    return extension in AUDIO_EXTENSIONS
+    # splitext avoids constructing a Path object on hot drag/selection paths
+    return os.path.splitext(file_path)[1].lower() in AUDIO_EXTENSIONS
 
 
 def save_recent_files(settings: Any, recent_files: List[str], max_count: int = 10) -> bool:
@@ -67,12 +67,13 @@ def save_recent_files(settings: Any, recent_files: List[str], max_count: int = 1
         return False
 
 
-def load_recent_files(settings: Any) -> List[str]:
+def load_recent_files(settings: Any, max_count: int = 10) -> List[str]:
     """
     Load recent files from settings.
 
     Args:
         settings: QSettings or similar settings object
+        max_count: Maximum number of files to load
 
     Returns:
         List of recent file paths
@@ -81,7 +82,8 @@ def load_recent_files(settings: Any) -> List[str]:
         if hasattr(settings, 'value'):
             recent_files_str = settings.value("recent_files", "")
             if recent_files_str:
-                files = json.loads(recent_files_str)
+                # Cap before filtering so at most max_count paths are stat'ed
+                files = json.loads(recent_files_str)[:max_count]
                 # Filter to files that still exist
                 valid_files = [f for f in files if os.path.exists(f)]
                 logger.debug(f"Loaded {len(valid_files)} recent files")
@@ -150,27 +152,28 @@ def validate_audio_file_path(file_path, logger):
     except Exception:
         return False, "Unable to normalize path"
 
-    # Check if file exists
-    if not os.path.exists(file_path):
+    # Check file extension first: a string test, while the checks below
+    # hit the filesystem (possibly a slow network share)
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext not in AUDIO_EXTENSIONS:
+        return False, f"Not an audio file: {file_ext}"
+
+    # Existence, type and size from a single stat call
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
         return False, f"File does not exist: {file_path}"
+    except Exception as e:
+        return False, f"Error checking file size: {str(e)}"
 
     # Check if it's a file (not a directory)
-    if not os.path.isfile(file_path):
+    if not stat.S_ISREG(file_stat.st_mode):
         return False, f"Not a file: {file_path}"
 
     # Check file size
-    try:
-        file_size = os.path.getsize(file_path)
-        if file_size == 0:
-            return False, f"File is empty: {file_path}"
-        logger.debug(f"File size: {file_size/1024:.1f} KB")
-    except Exception as e:
-        return False, f"Error checking file size: {str(e)}"
-
-    # Check file extension
-    file_ext = os.path.splitext(file_path.lower())[1]
-    if file_ext not in AUDIO_EXTENSIONS:
-        return False, f"Not an audio file: {file_ext}"
+    if file_stat.st_size == 0:
+        return False, f"File is empty: {file_path}"
+    logger.debug(f"File size: {file_stat.st_size/1024:.1f} KB")
 
     # Check file permissions
     try:
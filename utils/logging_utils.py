@@ -6,10 +6,14 @@ Provides centralized logging configuration with rotation and custom formatting.
 
 import os
 import sys
+import queue
 import logging
 import logging.handlers
 from typing import Optional, Dict
 
+# Listener thread that performs handler I/O for records queued by QueueHandler
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(
     log_dir: Optional[str] = None,
@@ -36,6 +40,8 @@ def setup_logging(
     Returns:
         Root logger instance
     """
+    global _queue_listener
+
     # Set up log directory
     if log_dir is None:
         if os.name == 'nt':  # Windows
@@ -49,6 +55,9 @@ def setup_logging(
     root_logger = logging.getLogger()
     
     # Clear existing handlers
+    shutdown_logging()
+    for handler in root_logger.handlers:
+        handler.close()
     root_logger.handlers = []
     
     # If logging is disabled, set up minimal logging
@@ -80,13 +89,20 @@ def setup_logging(
         encoding='utf-8'
     )
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    handlers = [file_handler]
 
     # Add console handler if requested
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # Logging threads only enqueue records; file/console I/O runs on the listener thread
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     # Set custom levels for specific modules
     if module_levels:
@@ -112,6 +128,29 @@ def setup_logging(
     return root_logger
 
 
+def shutdown_logging() -> None:
+    """
+    Stop the background log listener, flushing queued records to the handlers.
+
+    The file/console handlers are then attached to the root logger directly,
+    so records logged during teardown are still written (synchronously)
+    instead of being queued for a listener that no longer runs.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        # Attach the real handlers before detaching the queue, so no record
+        # logged meanwhile by another thread finds the root logger without one
+        root_logger = logging.getLogger()
+        for handler in _queue_listener.handlers:
+            root_logger.addHandler(handler)
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root_logger.removeHandler(handler)
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def get_module_logger(
     module_name: str,
     level: Optional[int] = None
@@ -0,0 +1,120 @@
+"""
+Windows mouse input utilities for AudioTooltip.
+Delivers middle button presses through a low-level mouse hook, so the
+listening thread sleeps in GetMessage instead of polling the button state,
+and hit-tests the window under the cursor.
+"""
+
+import ctypes
+from ctypes import wintypes
+import logging
+
+import win32api
+import win32gui
+
+# Low-level mouse hook constants (winuser.h)
+WH_MOUSE_LL = 14
+HC_ACTION = 0
+WM_MBUTTONDOWN = 0x0207
+WM_QUIT = 0x0012
+PM_NOREMOVE = 0x0000
+GA_ROOT = 2
+
+LRESULT = ctypes.c_ssize_t
+LowLevelMouseProc = ctypes.WINFUNCTYPE(LRESULT, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_user32.SetWindowsHookExW.argtypes = [
+    ctypes.c_int, LowLevelMouseProc, wintypes.HINSTANCE, wintypes.DWORD]
+_user32.SetWindowsHookExW.restype = wintypes.HHOOK
+_user32.CallNextHookEx.argtypes = [
+    wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
+_user32.CallNextHookEx.restype = LRESULT
+_user32.UnhookWindowsHookEx.argtypes = [wintypes.HHOOK]
+_user32.UnhookWindowsHookEx.restype = wintypes.BOOL
+_user32.GetMessageW.argtypes = [
+    ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+_user32.GetMessageW.restype = wintypes.BOOL
+_user32.PeekMessageW.argtypes = [
+    ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT]
+_user32.PeekMessageW.restype = wintypes.BOOL
+_user32.PostThreadMessageW.argtypes = [
+    wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+_user32.PostThreadMessageW.restype = wintypes.BOOL
+_user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+_user32.GetAncestor.restype = wintypes.HWND
+_kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+_kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+_kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+
+
+def root_window_under_cursor():
+    """Return the top-level HWND under the mouse cursor, or None"""
+    hwnd = win32gui.WindowFromPoint(win32api.GetCursorPos())
+    if not hwnd:
+        return None
+    return _user32.GetAncestor(hwnd, GA_ROOT) or None
+
+
+class MiddleClickListener:
+    """Calls a callback on every middle button press, from the thread running run()"""
+
+    def __init__(self, callback):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.callback = callback
+        self._thread_id = None
+        self._stopped = False
+        self._hook = None
+        # Keep a reference: the hook must not outlive its ctypes thunk
+        self._hook_proc = LowLevelMouseProc(self._mouse_proc)
+
+    def run(self):
+        """Pump messages for the mouse hook until stop() is called.
+
+        Returns:
+            bool: False if the hook could not be installed (the caller should
+            fall back to polling), True after a normal stop
+        """
+        msg = wintypes.MSG()
+        # Create this thread's message queue so stop() can post WM_QUIT to it
+        _user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_NOREMOVE)
+
+        self._hook = _user32.SetWindowsHookExW(
+            WH_MOUSE_LL, self._hook_proc, _kernel32.GetModuleHandleW(None), 0)
+        if not self._hook:
+            self.logger.warning(
+                f"SetWindowsHookEx failed: {ctypes.get_last_error()}")
+            return False
+
+        # Publish the thread before checking the flag, so stop() either sees
+        # the thread or its flag is seen here
+        self._thread_id = _kernel32.GetCurrentThreadId()
+        try:
+            if not self._stopped:
+                self.logger.info("Listening for middle clicks via mouse hook")
+                # Hook callbacks are dispatched while this thread waits here
+                while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                    pass
+        finally:
+            self._thread_id = None
+            _user32.UnhookWindowsHookEx(self._hook)
+            self._hook = None
+        return True
+
+    def stop(self):
+        """Make run() return; safe to call from any thread"""
+        self._stopped = True
+        thread_id = self._thread_id
+        if thread_id is not None:
+            _user32.PostThreadMessageW(thread_id, WM_QUIT, 0, 0)
+
+    def _mouse_proc(self, n_code, w_param, l_param):
+        # Called for every mouse event, moves included, so only a button
+        # press does any work; everything else is passed straight on
+        if n_code == HC_ACTION and w_param == WM_MBUTTONDOWN:
+            try:
+                self.callback()
+            except Exception as e:
+                self.logger.error(f"Middle click callback failed: {e}")
+        return _user32.CallNextHookEx(self._hook, n_code, w_param, l_param)
@@ -31,7 +31,7 @@ class StartupManager:
     def is_startup_enabled(self):
         """Check if the application is set to start with Windows"""
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, winreg.KEY_READ) as key:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, winreg.KEY_QUERY_VALUE) as key:
                 try:
                     value, _ = winreg.QueryValueEx(key, self.app_name)
                     # Check if the value matches our current executable path
@@ -59,7 +59,12 @@ class StartupManager:
         """Add the application to Windows startup"""
         try:
             startup_command = self.get_startup_command()
-            
+
+            # Query-only access first; reopen for writing only if the entry differs
+            if self.is_startup_enabled():
+                self.logger.info(f"Startup already enabled: {startup_command}")
+                return True
+
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, 
                               winreg.KEY_SET_VALUE) as key:
                 winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, startup_command)
@@ -106,7 +111,7 @@ class StartupManager:
         }
         
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, winreg.KEY_READ) as key:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, winreg.KEY_QUERY_VALUE) as key:
                 try:
                     current_value, _ = winreg.QueryValueEx(key, self.app_name)
                     info['current_registry_value'] = current_value